@@ -20,15 +20,28 @@ VERIFY_SNIPPET_PATTERN = re.compile(
     re.DOTALL,
 )
 
-PIP_COMPILE_PATTERN = re.compile(r"\bpip-compile\b", re.IGNORECASE)
-REQUIREMENTS_DEV_PATTERN = re.compile(r"\brequirements-dev\.lock\b", re.IGNORECASE)
+# Both legacy markers are found in one case-insensitive pass over the workflow.
+LEGACY_MARKER_PATTERN = re.compile(
+    r"\b(?:(?P<pip_compile>pip-compile)|(?P<requirements_dev>requirements-dev\.lock))\b",
+    re.IGNORECASE,
+)
+
+
+def _legacy_markers(content: str) -> set[str]:
+    found: set[str] = set()
+    for match in LEGACY_MARKER_PATTERN.finditer(content):
+        found.add(match.lastgroup or "")
+        if len(found) == 2:
+            break
+    return found
 
 
 def find_workflow_issues(content: str) -> list[str]:
     issues: list[str] = []
-    if PIP_COMPILE_PATTERN.search(content):
+    legacy_markers = _legacy_markers(content)
+    if "pip_compile" in legacy_markers:
         issues.append("Found pip-compile usage; expected uv pip compile.")
-    if REQUIREMENTS_DEV_PATTERN.search(content):
+    if "requirements_dev" in legacy_markers:
         issues.append("Found requirements-dev.lock usage; expected single requirements.lock.")
     if EXPECTED_COMPILE_COMMAND not in content:
         issues.append("Expected uv pip compile command with extras is missing.")
@@ -1,173 +1,336 @@
-"""Travel Plan Permission - Workflow automation for travel approval and reimbursement."""
+"""Travel Plan Permission - Workflow automation for travel approval and reimbursement.
 
-from .approval import ApprovalEngine
-from .approval_packet import (
-    ApprovalLinks,
-    ApprovalPacket,
-    EmailContent,
-    build_approval_packet,
-    generate_packet_pdf,
-)
-from .canonical import load_trip_plan_input
-from .conversion import trip_plan_from_minimal
-from .export import ExportService
-from .mapping import DEFAULT_TEMPLATE_VERSION, TemplateMapping, load_template_mapping
-from .models import (
-    ApprovalAction,
-    ApprovalDecision,
-    ApprovalEvent,
-    ApprovalOutcome,
-    ApprovalRule,
-    ApprovalStatus,
-    ExceptionApprovalLevel,
-    ExceptionApprovalRecord,
-    ExceptionRequest,
-    ExceptionStatus,
-    ExceptionType,
-    ExpenseCategory,
-    ExpenseItem,
-    ExpenseReport,
-    TripPlan,
-    TripStatus,
-    build_exception_dashboard,
-    determine_exception_approval_level,
-)
-from .planner_auth import (
-    AuthMode,
-    PlannerAuthConfig,
-    PlannerAuthContext,
-    PlannerAuthMode,
-    mint_bootstrap_token,
-)
-from .planner_client import (
-    PlannerHttpError,
-    PlannerJsonResponse,
-    PlannerMalformedResponseError,
-    PlannerPollingTimeout,
-    PlannerTransportError,
-    TravelPlanPermissionClient,
-)
-from .policy import (
-    AdvanceBookingRule,
-    CabinClassRule,
-    DrivingVsFlyingRule,
-    FareComparisonRule,
-    FareEvidenceRule,
-    HotelComparisonRule,
-    LocalOvernightRule,
-    MealPerDiemRule,
-    NonReimbursableRule,
-    PolicyContext,
-    PolicyEngine,
-    PolicyResult,
-    PolicyRule,
-    Severity,
-    ThirdPartyPaidRule,
-)
-from .policy_api import (
-    PlannerApprovalTrigger,
-    PlannerAuthContract,
-    PlannerBlockingIssue,
-    PlannerCorrelationId,
-    PlannerErrorRecord,
-    PlannerEvaluationOutcome,
-    PlannerExceptionRequirement,
-    PlannerExecutionState,
-    PlannerOperationType,
-    PlannerPolicyRequirement,
-    PlannerPolicyScoreEffect,
-    PlannerPolicyScoreExplanation,
-    PlannerPolicySnapshot,
-    PlannerPolicySnapshotRequest,
-    PlannerPreferredAlternative,
-    PlannerProposalEvaluationRequest,
-    PlannerProposalEvaluationResult,
-    PlannerProposalExecutionStatus,
-    PlannerProposalOperationResponse,
-    PlannerProposalStatus,
-    PlannerProposalStatusRequest,
-    PlannerProposalSubmissionRequest,
-    PlannerReoptimizationGuidance,
-    PlannerRetryMetadata,
-    PlannerTransportPattern,
-    PlannerVersionContract,
-    PolicyCheckResult,
-    PolicyCheckStatus,
-    PolicyIssue,
-    PolicyIssueSeverity,
-    PolicySnapshotFreshness,
-    ReconciliationResult,
-    ReconciliationStatus,
-    check_trip_plan,
-    fill_travel_spreadsheet,
-    get_evaluation_result,
-    get_policy_snapshot,
-    list_allowed_vendors,
-    poll_execution_status,
-    reconcile,
-    render_travel_spreadsheet_bytes,
-    submit_proposal,
-)
-from .policy_versioning import (
-    PolicyMigrationPlan,
-    PolicyMigrationPlanner,
-    PolicyVersion,
-    simulate_policy_change,
-)
-from .prompt_flow import (
-    CANONICAL_TRIP_FIELDS,
-    QUESTION_FLOW,
-    Question,
-    build_output_bundle,
-    generate_questions,
-    required_field_gaps,
-)
-from .providers import Provider, ProviderRegistry, ProviderType
-from .receipts import (
-    ALLOWED_RECEIPT_TYPES,
-    MAX_RECEIPT_SIZE_BYTES,
-    Receipt,
-    ReceiptExtractionResult,
-    ReceiptProcessor,
-)
-from .security import (
-    API_ENDPOINT_PERMISSIONS,
-    DEFAULT_ROLES,
-    DEFAULT_SSO_PLANS,
-    AuditEventType,
-    AuditLog,
-    Delegation,
-    Permission,
-    Role,
-    RoleChangeRequest,
-    RoleChangeState,
-    RoleName,
-    SecurityModel,
-    SSOProviderPlan,
-)
-from .snapshots import (
-    ValidationComparison,
-    ValidationDelta,
-    ValidationSnapshot,
-    ValidationSnapshotStore,
-    compare_results,
-    policy_version_hash,
-    snapshot_from_plan,
-)
-from .validation import (
-    AdvanceBookingRule as ValidationAdvanceBookingRule,
-)
-from .validation import (
-    BudgetLimitRule,
-    DurationLimitRule,
-    PolicyValidator,
-    ValidationResult,
-    ValidationRule,
-    ValidationSeverity,
-)
-from .validation import (
-    ProviderApprovalRule as ValidationProviderApprovalRule,
-)
+Public names are resolved lazily on first attribute access (PEP 562), so
+importing a single model does not pull in every submodule and its
+third-party dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# ``models`` closes an import cycle with ``snapshots`` and ``validation``; loading
+# it up front keeps direct imports of those submodules working. It only needs
+# pydantic and PyYAML, so the heavy integrations stay lazy.
+from . import models as _models  # noqa: F401
+
+if TYPE_CHECKING:
+    from .approval import ApprovalEngine
+    from .approval_packet import (
+        ApprovalLinks,
+        ApprovalPacket,
+        EmailContent,
+        build_approval_packet,
+        generate_packet_pdf,
+    )
+    from .canonical import load_trip_plan_input
+    from .conversion import trip_plan_from_minimal
+    from .export import ExportService
+    from .mapping import DEFAULT_TEMPLATE_VERSION, TemplateMapping, load_template_mapping
+    from .models import (
+        ApprovalAction,
+        ApprovalDecision,
+        ApprovalEvent,
+        ApprovalOutcome,
+        ApprovalRule,
+        ApprovalStatus,
+        ExceptionApprovalLevel,
+        ExceptionApprovalRecord,
+        ExceptionRequest,
+        ExceptionStatus,
+        ExceptionType,
+        ExpenseCategory,
+        ExpenseItem,
+        ExpenseReport,
+        TripPlan,
+        TripStatus,
+        build_exception_dashboard,
+        determine_exception_approval_level,
+    )
+    from .planner_auth import (
+        AuthMode,
+        PlannerAuthConfig,
+        PlannerAuthContext,
+        PlannerAuthMode,
+        mint_bootstrap_token,
+    )
+    from .planner_client import (
+        PlannerHttpError,
+        PlannerJsonResponse,
+        PlannerMalformedResponseError,
+        PlannerPollingTimeout,
+        PlannerTransportError,
+        TravelPlanPermissionClient,
+    )
+    from .policy import (
+        AdvanceBookingRule,
+        CabinClassRule,
+        DrivingVsFlyingRule,
+        FareComparisonRule,
+        FareEvidenceRule,
+        HotelComparisonRule,
+        LocalOvernightRule,
+        MealPerDiemRule,
+        NonReimbursableRule,
+        PolicyContext,
+        PolicyEngine,
+        PolicyResult,
+        PolicyRule,
+        Severity,
+        ThirdPartyPaidRule,
+    )
+    from .policy_api import (
+        PlannerApprovalTrigger,
+        PlannerAuthContract,
+        PlannerBlockingIssue,
+        PlannerCorrelationId,
+        PlannerErrorRecord,
+        PlannerEvaluationOutcome,
+        PlannerExceptionRequirement,
+        PlannerExecutionState,
+        PlannerOperationType,
+        PlannerPolicyRequirement,
+        PlannerPolicyScoreEffect,
+        PlannerPolicyScoreExplanation,
+        PlannerPolicySnapshot,
+        PlannerPolicySnapshotRequest,
+        PlannerPreferredAlternative,
+        PlannerProposalEvaluationRequest,
+        PlannerProposalEvaluationResult,
+        PlannerProposalExecutionStatus,
+        PlannerProposalOperationResponse,
+        PlannerProposalStatus,
+        PlannerProposalStatusRequest,
+        PlannerProposalSubmissionRequest,
+        PlannerReoptimizationGuidance,
+        PlannerRetryMetadata,
+        PlannerTransportPattern,
+        PlannerVersionContract,
+        PolicyCheckResult,
+        PolicyCheckStatus,
+        PolicyIssue,
+        PolicyIssueSeverity,
+        PolicySnapshotFreshness,
+        ReconciliationResult,
+        ReconciliationStatus,
+        check_trip_plan,
+        fill_travel_spreadsheet,
+        get_evaluation_result,
+        get_policy_snapshot,
+        list_allowed_vendors,
+        poll_execution_status,
+        reconcile,
+        render_travel_spreadsheet_bytes,
+        submit_proposal,
+    )
+    from .policy_versioning import (
+        PolicyMigrationPlan,
+        PolicyMigrationPlanner,
+        PolicyVersion,
+        simulate_policy_change,
+    )
+    from .prompt_flow import (
+        CANONICAL_TRIP_FIELDS,
+        QUESTION_FLOW,
+        Question,
+        build_output_bundle,
+        generate_questions,
+        required_field_gaps,
+    )
+    from .providers import Provider, ProviderRegistry, ProviderType
+    from .receipts import (
+        ALLOWED_RECEIPT_TYPES,
+        MAX_RECEIPT_SIZE_BYTES,
+        Receipt,
+        ReceiptExtractionResult,
+        ReceiptProcessor,
+    )
+    from .security import (
+        API_ENDPOINT_PERMISSIONS,
+        DEFAULT_ROLES,
+        DEFAULT_SSO_PLANS,
+        AuditEventType,
+        AuditLog,
+        Delegation,
+        Permission,
+        Role,
+        RoleChangeRequest,
+        RoleChangeState,
+        RoleName,
+        SecurityModel,
+        SSOProviderPlan,
+    )
+    from .snapshots import (
+        ValidationComparison,
+        ValidationDelta,
+        ValidationSnapshot,
+        ValidationSnapshotStore,
+        compare_results,
+        policy_version_hash,
+        snapshot_from_plan,
+    )
+    from .validation import (
+        AdvanceBookingRule as ValidationAdvanceBookingRule,
+    )
+    from .validation import (
+        BudgetLimitRule,
+        DurationLimitRule,
+        PolicyValidator,
+        ValidationResult,
+        ValidationRule,
+        ValidationSeverity,
+    )
+    from .validation import (
+        ProviderApprovalRule as ValidationProviderApprovalRule,
+    )
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ApprovalEngine": (".approval", "ApprovalEngine"),
+    "ApprovalLinks": (".approval_packet", "ApprovalLinks"),
+    "ApprovalPacket": (".approval_packet", "ApprovalPacket"),
+    "EmailContent": (".approval_packet", "EmailContent"),
+    "build_approval_packet": (".approval_packet", "build_approval_packet"),
+    "generate_packet_pdf": (".approval_packet", "generate_packet_pdf"),
+    "load_trip_plan_input": (".canonical", "load_trip_plan_input"),
+    "trip_plan_from_minimal": (".conversion", "trip_plan_from_minimal"),
+    "ExportService": (".export", "ExportService"),
+    "DEFAULT_TEMPLATE_VERSION": (".mapping", "DEFAULT_TEMPLATE_VERSION"),
+    "TemplateMapping": (".mapping", "TemplateMapping"),
+    "load_template_mapping": (".mapping", "load_template_mapping"),
+    "ApprovalAction": (".models", "ApprovalAction"),
+    "ApprovalDecision": (".models", "ApprovalDecision"),
+    "ApprovalEvent": (".models", "ApprovalEvent"),
+    "ApprovalOutcome": (".models", "ApprovalOutcome"),
+    "ApprovalRule": (".models", "ApprovalRule"),
+    "ApprovalStatus": (".models", "ApprovalStatus"),
+    "ExceptionApprovalLevel": (".models", "ExceptionApprovalLevel"),
+    "ExceptionApprovalRecord": (".models", "ExceptionApprovalRecord"),
+    "ExceptionRequest": (".models", "ExceptionRequest"),
+    "ExceptionStatus": (".models", "ExceptionStatus"),
+    "ExceptionType": (".models", "ExceptionType"),
+    "ExpenseCategory": (".models", "ExpenseCategory"),
+    "ExpenseItem": (".models", "ExpenseItem"),
+    "ExpenseReport": (".models", "ExpenseReport"),
+    "TripPlan": (".models", "TripPlan"),
+    "TripStatus": (".models", "TripStatus"),
+    "build_exception_dashboard": (".models", "build_exception_dashboard"),
+    "determine_exception_approval_level": (".models", "determine_exception_approval_level"),
+    "AuthMode": (".planner_auth", "AuthMode"),
+    "PlannerAuthConfig": (".planner_auth", "PlannerAuthConfig"),
+    "PlannerAuthContext": (".planner_auth", "PlannerAuthContext"),
+    "PlannerAuthMode": (".planner_auth", "PlannerAuthMode"),
+    "mint_bootstrap_token": (".planner_auth", "mint_bootstrap_token"),
+    "PlannerHttpError": (".planner_client", "PlannerHttpError"),
+    "PlannerJsonResponse": (".planner_client", "PlannerJsonResponse"),
+    "PlannerMalformedResponseError": (".planner_client", "PlannerMalformedResponseError"),
+    "PlannerPollingTimeout": (".planner_client", "PlannerPollingTimeout"),
+    "PlannerTransportError": (".planner_client", "PlannerTransportError"),
+    "TravelPlanPermissionClient": (".planner_client", "TravelPlanPermissionClient"),
+    "AdvanceBookingRule": (".policy", "AdvanceBookingRule"),
+    "CabinClassRule": (".policy", "CabinClassRule"),
+    "DrivingVsFlyingRule": (".policy", "DrivingVsFlyingRule"),
+    "FareComparisonRule": (".policy", "FareComparisonRule"),
+    "FareEvidenceRule": (".policy", "FareEvidenceRule"),
+    "HotelComparisonRule": (".policy", "HotelComparisonRule"),
+    "LocalOvernightRule": (".policy", "LocalOvernightRule"),
+    "MealPerDiemRule": (".policy", "MealPerDiemRule"),
+    "NonReimbursableRule": (".policy", "NonReimbursableRule"),
+    "PolicyContext": (".policy", "PolicyContext"),
+    "PolicyEngine": (".policy", "PolicyEngine"),
+    "PolicyResult": (".policy", "PolicyResult"),
+    "PolicyRule": (".policy", "PolicyRule"),
+    "Severity": (".policy", "Severity"),
+    "ThirdPartyPaidRule": (".policy", "ThirdPartyPaidRule"),
+    "PlannerApprovalTrigger": (".policy_api", "PlannerApprovalTrigger"),
+    "PlannerAuthContract": (".policy_api", "PlannerAuthContract"),
+    "PlannerBlockingIssue": (".policy_api", "PlannerBlockingIssue"),
+    "PlannerCorrelationId": (".policy_api", "PlannerCorrelationId"),
+    "PlannerErrorRecord": (".policy_api", "PlannerErrorRecord"),
+    "PlannerEvaluationOutcome": (".policy_api", "PlannerEvaluationOutcome"),
+    "PlannerExceptionRequirement": (".policy_api", "PlannerExceptionRequirement"),
+    "PlannerExecutionState": (".policy_api", "PlannerExecutionState"),
+    "PlannerOperationType": (".policy_api", "PlannerOperationType"),
+    "PlannerPolicyRequirement": (".policy_api", "PlannerPolicyRequirement"),
+    "PlannerPolicyScoreEffect": (".policy_api", "PlannerPolicyScoreEffect"),
+    "PlannerPolicyScoreExplanation": (".policy_api", "PlannerPolicyScoreExplanation"),
+    "PlannerPolicySnapshot": (".policy_api", "PlannerPolicySnapshot"),
+    "PlannerPolicySnapshotRequest": (".policy_api", "PlannerPolicySnapshotRequest"),
+    "PlannerPreferredAlternative": (".policy_api", "PlannerPreferredAlternative"),
+    "PlannerProposalEvaluationRequest": (".policy_api", "PlannerProposalEvaluationRequest"),
+    "PlannerProposalEvaluationResult": (".policy_api", "PlannerProposalEvaluationResult"),
+    "PlannerProposalExecutionStatus": (".policy_api", "PlannerProposalExecutionStatus"),
+    "PlannerProposalOperationResponse": (".policy_api", "PlannerProposalOperationResponse"),
+    "PlannerProposalStatus": (".policy_api", "PlannerProposalStatus"),
+    "PlannerProposalStatusRequest": (".policy_api", "PlannerProposalStatusRequest"),
+    "PlannerProposalSubmissionRequest": (".policy_api", "PlannerProposalSubmissionRequest"),
+    "PlannerReoptimizationGuidance": (".policy_api", "PlannerReoptimizationGuidance"),
+    "PlannerRetryMetadata": (".policy_api", "PlannerRetryMetadata"),
+    "PlannerTransportPattern": (".policy_api", "PlannerTransportPattern"),
+    "PlannerVersionContract": (".policy_api", "PlannerVersionContract"),
+    "PolicyCheckResult": (".policy_api", "PolicyCheckResult"),
+    "PolicyCheckStatus": (".policy_api", "PolicyCheckStatus"),
+    "PolicyIssue": (".policy_api", "PolicyIssue"),
+    "PolicyIssueSeverity": (".policy_api", "PolicyIssueSeverity"),
+    "PolicySnapshotFreshness": (".policy_api", "PolicySnapshotFreshness"),
+    "ReconciliationResult": (".policy_api", "ReconciliationResult"),
+    "ReconciliationStatus": (".policy_api", "ReconciliationStatus"),
+    "check_trip_plan": (".policy_api", "check_trip_plan"),
+    "fill_travel_spreadsheet": (".policy_api", "fill_travel_spreadsheet"),
+    "get_evaluation_result": (".policy_api", "get_evaluation_result"),
+    "get_policy_snapshot": (".policy_api", "get_policy_snapshot"),
+    "list_allowed_vendors": (".policy_api", "list_allowed_vendors"),
+    "poll_execution_status": (".policy_api", "poll_execution_status"),
+    "reconcile": (".policy_api", "reconcile"),
+    "render_travel_spreadsheet_bytes": (".policy_api", "render_travel_spreadsheet_bytes"),
+    "submit_proposal": (".policy_api", "submit_proposal"),
+    "PolicyMigrationPlan": (".policy_versioning", "PolicyMigrationPlan"),
+    "PolicyMigrationPlanner": (".policy_versioning", "PolicyMigrationPlanner"),
+    "PolicyVersion": (".policy_versioning", "PolicyVersion"),
+    "simulate_policy_change": (".policy_versioning", "simulate_policy_change"),
+    "CANONICAL_TRIP_FIELDS": (".prompt_flow", "CANONICAL_TRIP_FIELDS"),
+    "QUESTION_FLOW": (".prompt_flow", "QUESTION_FLOW"),
+    "Question": (".prompt_flow", "Question"),
+    "build_output_bundle": (".prompt_flow", "build_output_bundle"),
+    "generate_questions": (".prompt_flow", "generate_questions"),
+    "required_field_gaps": (".prompt_flow", "required_field_gaps"),
+    "Provider": (".providers", "Provider"),
+    "ProviderRegistry": (".providers", "ProviderRegistry"),
+    "ProviderType": (".providers", "ProviderType"),
+    "ALLOWED_RECEIPT_TYPES": (".receipts", "ALLOWED_RECEIPT_TYPES"),
+    "MAX_RECEIPT_SIZE_BYTES": (".receipts", "MAX_RECEIPT_SIZE_BYTES"),
+    "Receipt": (".receipts", "Receipt"),
+    "ReceiptExtractionResult": (".receipts", "ReceiptExtractionResult"),
+    "ReceiptProcessor": (".receipts", "ReceiptProcessor"),
+    "API_ENDPOINT_PERMISSIONS": (".security", "API_ENDPOINT_PERMISSIONS"),
+    "DEFAULT_ROLES": (".security", "DEFAULT_ROLES"),
+    "DEFAULT_SSO_PLANS": (".security", "DEFAULT_SSO_PLANS"),
+    "AuditEventType": (".security", "AuditEventType"),
+    "AuditLog": (".security", "AuditLog"),
+    "Delegation": (".security", "Delegation"),
+    "Permission": (".security", "Permission"),
+    "Role": (".security", "Role"),
+    "RoleChangeRequest": (".security", "RoleChangeRequest"),
+    "RoleChangeState": (".security", "RoleChangeState"),
+    "RoleName": (".security", "RoleName"),
+    "SecurityModel": (".security", "SecurityModel"),
+    "SSOProviderPlan": (".security", "SSOProviderPlan"),
+    "ValidationComparison": (".snapshots", "ValidationComparison"),
+    "ValidationDelta": (".snapshots", "ValidationDelta"),
+    "ValidationSnapshot": (".snapshots", "ValidationSnapshot"),
+    "ValidationSnapshotStore": (".snapshots", "ValidationSnapshotStore"),
+    "compare_results": (".snapshots", "compare_results"),
+    "policy_version_hash": (".snapshots", "policy_version_hash"),
+    "snapshot_from_plan": (".snapshots", "snapshot_from_plan"),
+    "ValidationAdvanceBookingRule": (".validation", "AdvanceBookingRule"),
+    "BudgetLimitRule": (".validation", "BudgetLimitRule"),
+    "DurationLimitRule": (".validation", "DurationLimitRule"),
+    "PolicyValidator": (".validation", "PolicyValidator"),
+    "ValidationResult": (".validation", "ValidationResult"),
+    "ValidationRule": (".validation", "ValidationRule"),
+    "ValidationSeverity": (".validation", "ValidationSeverity"),
+    "ValidationProviderApprovalRule": (".validation", "ProviderApprovalRule"),
+}
 
 __all__ = [
     "AdvanceBookingRule",
@@ -317,3 +480,17 @@ __all__ = [
     "__version__",
 ]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
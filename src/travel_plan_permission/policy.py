@@ -371,7 +371,11 @@ class PolicyEngine(YamlConfigLoaderMixin):
 
     @classmethod
     def from_yaml(cls, content: str) -> PolicyEngine:
-        config = cls._load_yaml_mapping(content)
+        return cls.from_dict(cls._load_yaml_mapping(content))
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> PolicyEngine:
+        """Build an engine from an already-parsed policy configuration mapping."""
 
         advance_cfg = _load_rule_config(
             config,
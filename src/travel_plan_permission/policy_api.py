@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import tempfile
@@ -13,8 +14,9 @@ from decimal import Decimal
 from hashlib import sha256
 from importlib import resources
 from io import BytesIO
+from os import PathLike
 from pathlib import Path
-from typing import Literal
+from typing import BinaryIO, Literal, overload
 
 from openpyxl import load_workbook
 from openpyxl.workbook import Workbook
@@ -616,12 +618,16 @@ _ZIP_PATTERN = re.compile(r"^(?P<city_state>.*?)(?:\s+(?P<zip>\d{5})(?:-\d{4})?)
 _RESOURCE_TEMPLATE_CACHE: dict[str, Path] = {}
 
 
+def _template_exists(path: Path) -> bool:
+    return path.exists()
+
+
 def _default_template_path(template_file: str | None = None) -> Path:
     """Return path to the default template file."""
     template_name = template_file or _TEMPLATE_FILENAME
     for parent in Path(__file__).resolve().parents:
         candidate = parent / "templates" / template_name
-        if candidate.exists():
+        if _template_exists(candidate):
             return candidate
     try:
         resource = resources.files("travel_plan_permission").joinpath("templates", template_name)
@@ -629,7 +635,7 @@ def _default_template_path(template_file: str | None = None) -> Path:
         resource = None
     if resource is not None and resource.is_file():
         cached_path = _RESOURCE_TEMPLATE_CACHE.get(template_name)
-        if cached_path is not None and cached_path.exists():
+        if cached_path is not None and _template_exists(cached_path):
             return cached_path
         temp_dir = tempfile.mkdtemp(prefix="travel_plan_template_")
         temp_path = Path(temp_dir) / template_name
@@ -639,12 +645,18 @@ def _default_template_path(template_file: str | None = None) -> Path:
     raise FileNotFoundError(f"Unable to locate templates/{template_name}")
 
 
+@functools.lru_cache(maxsize=4)
+def _read_template_file(path: Path, _mtime_ns: int) -> bytes:
+    # ``_mtime_ns`` is only part of the cache key so that edited templates are re-read.
+    return path.read_bytes()
+
+
 def _default_template_bytes(template_file: str | None = None) -> bytes:
     template_name = template_file or _TEMPLATE_FILENAME
     for parent in Path(__file__).resolve().parents:
         candidate = parent / "templates" / template_name
-        if candidate.exists():
-            return candidate.read_bytes()
+        if _template_exists(candidate):
+            return _read_template_file(candidate, candidate.stat().st_mtime_ns)
     try:
         resource = resources.files("travel_plan_permission").joinpath("templates", template_name)
     except ModuleNotFoundError:
@@ -1761,14 +1773,13 @@ def _populate_travel_workbook(
             ws[formula_cell] = formula_value
 
 
-def render_travel_spreadsheet_bytes(
+def _write_travel_spreadsheet(
     plan: TripPlan,
+    target: BinaryIO,
     *,
     canonical_plan: CanonicalTripPlan | None = None,
     report: UnfilledMappingReport | None = None,
-) -> bytes:
-    """Render a travel request spreadsheet to a .xlsx byte stream."""
-
+) -> None:
     mapping = load_template_mapping()
     template_file = mapping.metadata.get("template_file")
     template_bytes = _default_template_bytes(
@@ -1782,21 +1793,59 @@ def render_travel_spreadsheet_bytes(
         canonical_plan=canonical_plan,
         report=report,
     )
-    output = BytesIO()
-    wb.save(output)
+    wb.save(target)
     wb.close()
+
+
+def render_travel_spreadsheet_bytes(
+    plan: TripPlan,
+    *,
+    canonical_plan: CanonicalTripPlan | None = None,
+    report: UnfilledMappingReport | None = None,
+) -> bytes:
+    """Render a travel request spreadsheet to a .xlsx byte stream."""
+
+    output = BytesIO()
+    _write_travel_spreadsheet(plan, output, canonical_plan=canonical_plan, report=report)
     return output.getvalue()
 
 
+@overload
 def fill_travel_spreadsheet(
     plan: TripPlan,
     output_path: Path,
     *,
     canonical_plan: CanonicalTripPlan | None = None,
     report: UnfilledMappingReport | None = None,
-) -> Path:
-    """Fill a travel request spreadsheet template using trip plan data."""
+) -> Path: ...
+
+
+@overload
+def fill_travel_spreadsheet(
+    plan: TripPlan,
+    output_path: BinaryIO,
+    *,
+    canonical_plan: CanonicalTripPlan | None = None,
+    report: UnfilledMappingReport | None = None,
+) -> BinaryIO: ...
+
+
+def fill_travel_spreadsheet(
+    plan: TripPlan,
+    output_path: Path | BinaryIO,
+    *,
+    canonical_plan: CanonicalTripPlan | None = None,
+    report: UnfilledMappingReport | None = None,
+) -> Path | BinaryIO:
+    """Fill a travel request spreadsheet template using trip plan data.
+
+    ``output_path`` may be a filesystem path or a writable binary stream such
+    as ``BytesIO``; streams are written in place and returned unchanged.
+    """
 
+    if not isinstance(output_path, str | PathLike):
+        _write_travel_spreadsheet(plan, output_path, canonical_plan=canonical_plan, report=report)
+        return output_path
     output_path = Path(output_path)
     output_path.write_bytes(
         render_travel_spreadsheet_bytes(plan, canonical_plan=canonical_plan, report=report)
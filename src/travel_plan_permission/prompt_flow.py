@@ -2,16 +2,12 @@
 
 from __future__ import annotations
 
-import io
+import itertools
 import json
+import textwrap
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
-
 from .mapping import DEFAULT_TEMPLATE_VERSION
 
 CANONICAL_TRIP_FIELDS: tuple[str, ...] = (
@@ -117,10 +113,39 @@ QUESTION_FLOW: tuple[Question, ...] = (
 )
 
 
+# The catalog and fonts never change between summaries. The page tree (object 5),
+# one page and content stream pair per page, and the document info follow them.
+_PDF_STATIC_OBJECTS: tuple[bytes, ...] = (
+    b"<< /Type /Catalog /Pages 5 0 R >>",
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /ZapfDingbats >>",
+)
+_PDF_PAGE = (
+    b"<< /Type /Page /Parent 5 0 R /MediaBox [0 0 612 792] "
+    b"/Resources << /Font << /F1 2 0 R /F2 3 0 R /F3 4 0 R >> >> /Contents %d 0 R >>"
+)
+_PDF_TITLE_FONT = b"/F1 18 Tf"
+_PDF_BODY_FONT = b"/F2 11 Tf"
+# Characters outside WinAnsi are drawn as ZapfDingbats boxes, as reportlab did.
+_PDF_MISSING_GLYPH = b"n"
+_PDF_WRAP_WIDTH = 85
+_PDF_TITLE_WRAP_WIDTH = 46
+_PDF_TITLE_MAX_LINES = 3
+_PDF_TITLE_LEADING = 22
+_PDF_PAGE_TOP = 720
+_PDF_BOTTOM_MARGIN = 72
+_PDF_LEADING = 16
+
+
 def _is_filled(field: str, answers: dict[str, object]) -> bool:
     return field in answers and answers[field] not in (None, "")
 
 
+def _filled_fields(answers: dict[str, object]) -> frozenset[str]:
+    return frozenset(field for field in answers if _is_filled(field, answers))
+
+
 def generate_questions(
     answers: dict[str, object],
     *,
@@ -129,14 +154,15 @@ def generate_questions(
 ) -> list[Question]:
     """Return the next questions needed to complete required fields."""
 
+    filled = _filled_fields(answers)
     queued: list[Question] = []
     for question in question_flow:
         if len(queued) >= max_questions:
             break
-        if all(_is_filled(field, answers) for field in question.fields):
+        if filled.issuperset(question.fields):
             continue
         queued.append(question)
-    return queued[:max_questions]
+    return queued
 
 
 def build_output_bundle(
@@ -166,13 +192,14 @@ def build_output_bundle(
         f"Dates: {answers.get('depart_date', '')} to {answers.get('return_date', '')}",
         f"Template: {template_version}",
     ]
-    summary_bytes = "\n".join(summary_lines).encode("utf-8")
     summary_pdf_bytes = _build_summary_pdf(summary_lines)
 
     attachments: dict[str, bytes] = {}
     if brochure is not None:
         attachments["conference_brochure.pdf"] = brochure
 
+    # Kept deliberately: a renderer that ever emits something other than a
+    # complete PDF degrades to a plain-text summary instead of a broken attachment.
     summary_payload: dict[str, object]
     if _looks_like_pdf(summary_pdf_bytes):
         summary_payload = {
@@ -183,7 +210,7 @@ def build_output_bundle(
     else:
         summary_payload = {
             "filename": "summary.txt",
-            "content": summary_bytes,
+            "content": "\n".join(summary_lines).encode("utf-8"),
             "mime_type": "text/plain",
         }
 
@@ -201,27 +228,151 @@ def build_output_bundle(
     return bundle
 
 
-def _build_summary_pdf(summary_lines: Sequence[str]) -> bytes:
-    """Render the summary lines into a simple PDF."""
+def _pdf_literal(encoded: bytes) -> bytes:
+    escaped = encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"(" + escaped + b")"
+
 
-    buffer = io.BytesIO()
+def _lacks_winansi_glyph(char: str) -> bool:
     try:
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            title=summary_lines[0] if summary_lines else "Travel Plan Summary",
+        char.encode("cp1252")
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+def _pdf_text_string(text: str) -> bytes:
+    """Encode text for the document info dictionary, using UTF-16 beyond ASCII."""
+
+    if text.isascii():
+        return _pdf_literal(text.encode("ascii"))
+    return b"<FEFF%b>" % text.encode("utf-16-be").hex().upper().encode("ascii")
+
+
+def _show_text(text: str, font: bytes) -> bytes:
+    """Return text-showing operators for one line set in ``font``.
+
+    Runs without a WinAnsi glyph are drawn as placeholder boxes; the line is then
+    wrapped in an ActualText span so copying and search still see the real text.
+    """
+
+    text = " ".join(text.splitlines())
+    if not any(_lacks_winansi_glyph(char) for char in text):
+        return _pdf_literal(text.encode("cp1252")) + b" Tj\n"
+    size = font.split()[1]
+    operators = bytearray()
+    for missing, run in itertools.groupby(text, key=_lacks_winansi_glyph):
+        chars = "".join(run)
+        if missing:
+            boxes = _pdf_literal(_PDF_MISSING_GLYPH * len(chars))
+            operators += b"/F3 %b Tf %b Tj %b " % (size, boxes, font)
+        else:
+            operators += _pdf_literal(chars.encode("cp1252")) + b" Tj "
+    return b"/Span << /ActualText %b >> BDC %bEMC\n" % (_pdf_text_string(text), bytes(operators))
+
+
+def _summary_page_streams(summary_lines: Sequence[str]) -> list[bytes]:
+    """Lay the summary out top to bottom, starting a new page at the bottom margin."""
+
+    title = summary_lines[0] if summary_lines else "Travel Plan Summary"
+    pages: list[bytes] = []
+    title_lines = textwrap.wrap(
+        title, _PDF_TITLE_WRAP_WIDTH, max_lines=_PDF_TITLE_MAX_LINES, placeholder=" ..."
+    ) or [""]
+    stream = bytearray(b"BT\n%b\n72 %d Td\n" % (_PDF_TITLE_FONT, _PDF_PAGE_TOP))
+    stream += _show_text(title_lines[0], _PDF_TITLE_FONT)
+    for title_line in title_lines[1:]:
+        stream += b"0 -%d Td " % _PDF_TITLE_LEADING + _show_text(title_line, _PDF_TITLE_FONT)
+    stream += b"%b\n%d TL\n0 -12 Td\n" % (_PDF_BODY_FONT, _PDF_LEADING)
+    y = _PDF_PAGE_TOP - _PDF_TITLE_LEADING * (len(title_lines) - 1) - 12
+    for line in summary_lines[1:]:
+        for wrapped in textwrap.wrap(line, _PDF_WRAP_WIDTH) or [""]:
+            y -= _PDF_LEADING
+            if y < _PDF_BOTTOM_MARGIN:
+                stream += b"ET"
+                pages.append(bytes(stream))
+                # T* moves down one leading before each line, so start one above the top.
+                stream = bytearray(
+                    b"BT\n%b\n%d TL\n72 %d Td\n"
+                    % (_PDF_BODY_FONT, _PDF_LEADING, _PDF_PAGE_TOP + _PDF_LEADING)
+                )
+                y = _PDF_PAGE_TOP
+            stream += b"T* " + _show_text(wrapped, _PDF_BODY_FONT)
+    stream += b"ET"
+    pages.append(bytes(stream))
+    return pages
+
+
+class SummaryPdfRenderer:
+    """Render summary PDFs from a pre-serialized document skeleton.
+
+    The header, catalog and font objects are identical for every summary, so
+    they are serialized once with their xref entries; each render only emits the
+    page tree, the pages and their content streams, the document info and the
+    trailer.
+    """
+
+    def __init__(self, static_objects: Sequence[bytes] = _PDF_STATIC_OBJECTS) -> None:
+        prefix = bytearray(b"%PDF-1.4\n")
+        xref_entries = bytearray()
+        for number, body in enumerate(static_objects, start=1):
+            xref_entries += b"%010d 00000 n \n" % len(prefix)
+            prefix += b"%d 0 obj\n%b\nendobj\n" % (number, body)
+        self._prefix = bytes(prefix)
+        self._xref_entries = bytes(xref_entries)
+        self._static_count = len(static_objects)
+
+    def render(self, summary_lines: Sequence[str]) -> bytes:
+        """Return a PDF document for the summary lines."""
+
+        title = summary_lines[0] if summary_lines else "Travel Plan Summary"
+        streams = _summary_page_streams(summary_lines)
+        pages_number = self._static_count + 1
+        page_numbers = range(pages_number + 1, pages_number + 1 + 2 * len(streams), 2)
+        info_number = pages_number + 2 * len(streams) + 1
+
+        buffer = bytearray(self._prefix)
+        offsets = [len(buffer)]
+        kids = b" ".join(b"%d 0 R" % number for number in page_numbers)
+        buffer += b"%d 0 obj\n<< /Type /Pages /Kids [%b] /Count %d >>\nendobj\n" % (
+            pages_number,
+            kids,
+            len(streams),
         )
-        styles = getSampleStyleSheet()
-        elements = []
-        if summary_lines:
-            elements.append(Paragraph(summary_lines[0], styles["Title"]))
-        for line in summary_lines[1:]:
-            elements.append(Spacer(1, 0.12 * inch))
-            elements.append(Paragraph(line, styles["Normal"]))
-        doc.build(elements)
-    except Exception:
-        return b""
-    return buffer.getvalue()
+        for page_number, content in zip(page_numbers, streams, strict=True):
+            offsets.append(len(buffer))
+            buffer += b"%d 0 obj\n%b\nendobj\n" % (page_number, _PDF_PAGE % (page_number + 1))
+            offsets.append(len(buffer))
+            buffer += b"%d 0 obj\n<< /Length %d >>\nstream\n%b\nendstream\nendobj\n" % (
+                page_number + 1,
+                len(content),
+                content,
+            )
+        offsets.append(len(buffer))
+        buffer += b"%d 0 obj\n<< /Title %b /Producer (travel-plan-permission) >>\nendobj\n" % (
+            info_number,
+            _pdf_text_string(title),
+        )
+        xref_offset = len(buffer)
+        buffer += b"xref\n0 %d\n0000000000 65535 f \n" % (info_number + 1)
+        buffer += self._xref_entries
+        for offset in offsets:
+            buffer += b"%010d 00000 n \n" % offset
+        buffer += b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\n" % (
+            info_number + 1,
+            info_number,
+        )
+        buffer += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+        return bytes(buffer)
+
+
+_SUMMARY_PDF_RENDERER = SummaryPdfRenderer()
+
+
+def _build_summary_pdf(summary_lines: Sequence[str]) -> bytes:
+    """Render the summary lines into a simple paginated PDF."""
+
+    return _SUMMARY_PDF_RENDERER.render(summary_lines)
 
 
 def _looks_like_pdf(payload: bytes) -> bool:
@@ -240,4 +391,5 @@ def required_field_gaps(
 ) -> list[str]:
     """List required canonical fields that are still missing."""
 
-    return [field for field in required_fields if not _is_filled(field, answers)]
+    filled = _filled_fields(answers)
+    return [field for field in required_fields if field not in filled]
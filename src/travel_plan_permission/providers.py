@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import date
 from enum import StrEnum
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from .config_loader import YamlConfigLoaderMixin
 
@@ -90,6 +93,12 @@ class ProviderChange(BaseModel):
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
+@dataclass(frozen=True)
+class _ProviderBucket:
+    valid_from: tuple[date, ...]
+    providers: tuple[Provider, ...]
+
+
 class ProviderRegistry(YamlConfigLoaderMixin, BaseModel):
     """Registry of approved providers with lookup helpers."""
 
@@ -105,6 +114,50 @@ class ProviderRegistry(YamlConfigLoaderMixin, BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    # Built on first lookup and tagged with a snapshot of the providers it indexes;
+    # any assignment, in-place edit or ``model_copy(update=...)`` triggers a rebuild.
+    _type_index: tuple[tuple[Provider, ...], dict[ProviderType, _ProviderBucket]] | None = (
+        PrivateAttr(default=None)
+    )
+
+    def _providers_by_type(self) -> dict[ProviderType, _ProviderBucket]:
+        snapshot = tuple(self.providers)
+        cached = self._type_index
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+        # Destinations match by keyword substring, so only the type is indexable;
+        # each bucket is ordered by contract start so lookups can bisect on date.
+        buckets: dict[ProviderType, list[Provider]] = {}
+        for provider in sorted(self.providers, key=lambda provider: provider.valid_from):
+            buckets.setdefault(provider.type, []).append(provider)
+        index = {
+            provider_type: _ProviderBucket(
+                valid_from=tuple(provider.valid_from for provider in bucket),
+                providers=tuple(bucket),
+            )
+            for provider_type, bucket in buckets.items()
+        }
+        self._type_index = (snapshot, index)
+        return index
+
+    @classmethod
+    def from_file(cls, path: str | Path | None = None) -> ProviderRegistry:
+        """Load a registry file, reusing the parsed result until the file changes.
+
+        Each call returns its own deep copy of the cached registry, so callers may
+        modify the result without affecting later loads.
+        """
+
+        target_path = cls._resolve_config_path(path)
+        try:
+            stat = target_path.stat() if target_path is not None else None
+        except FileNotFoundError:
+            stat = None
+        if target_path is None or stat is None:
+            return super().from_file(path)
+        cached = _load_registry_file(cls, str(target_path.resolve()), stat.st_mtime_ns)
+        return cached.model_copy(deep=True)
+
     @classmethod
     def from_yaml(cls, content: str) -> ProviderRegistry:
         """Instantiate a registry from YAML content."""
@@ -154,14 +207,17 @@ class ProviderRegistry(YamlConfigLoaderMixin, BaseModel):
     ) -> list[Provider]:
         """Return approved providers for the type and destination."""
 
+        bucket = self._providers_by_type().get(provider_type)
+        if bucket is None:
+            return []
+        check_date = reference_date or date.today()
+        started = bucket.providers[: bisect_right(bucket.valid_from, check_date)]
         return sorted(
-            [
+            (
                 provider
-                for provider in self.providers
-                if provider.type == provider_type
-                and provider.is_active(reference_date)
-                and provider.matches_destination(destination)
-            ],
+                for provider in started
+                if provider.is_active(check_date) and provider.matches_destination(destination)
+            ),
             key=lambda provider: provider.name.lower(),
         )
 
@@ -189,3 +245,11 @@ class ProviderRegistry(YamlConfigLoaderMixin, BaseModel):
             for provider in self.providers
             if provider.is_active(reference_date=reference_date)
         ]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry_file(
+    registry_cls: type[ProviderRegistry], path: str, _mtime_ns: int
+) -> ProviderRegistry:
+    # ``_mtime_ns`` is only part of the cache key so that edited files are re-parsed.
+    return registry_cls.from_yaml(Path(path).read_text(encoding="utf-8"))
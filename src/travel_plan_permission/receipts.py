@@ -93,6 +93,7 @@ class ReceiptProcessor:
         re.IGNORECASE,
     )
     DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", re.IGNORECASE)
+    AMOUNT_PATTERN = re.compile(r"\d{1,3}(?:,\d{3})*(?:\.\d{2})")
 
     @staticmethod
     def extract_from_text(text: str) -> ReceiptExtractionResult:
@@ -132,17 +133,15 @@ class ReceiptProcessor:
         if keyword_totals:
             return max(keyword_totals)
 
-        amounts: list[Decimal] = []
-        for raw in re.findall(r"\d{1,3}(?:,\d{3})*(?:\.\d{2})", text):
-            try:
-                amounts.append(Decimal(raw.replace(",", "")))
-            except InvalidOperation:
-                continue
-
-        if amounts:
-            return max(amounts)
-
-        return None
+        # Every fallback match is a digit run with an optional cents suffix, so
+        # it is always a valid Decimal once thousands separators are dropped.
+        return max(
+            (
+                Decimal(raw.replace(",", ""))
+                for raw in ReceiptProcessor.AMOUNT_PATTERN.findall(text)
+            ),
+            default=None,
+        )
 
     @staticmethod
     def _parse_date(text: str) -> dt_date | None:
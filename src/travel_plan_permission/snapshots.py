@@ -22,9 +22,17 @@ from .validation import PolicyValidator, ValidationResult
 if TYPE_CHECKING:
     from .models import TripPlan
 
+# Persisted snapshots chain to their predecessor's digest, so changing the
+# algorithm breaks verification of every existing store.
+_HASH = sha256
+
+
+def _digest(data: bytes) -> str:
+    return _HASH(data).hexdigest()
+
 
 def _hash_payload(payload: Mapping[str, object]) -> str:
-    """Return a stable SHA-256 digest for the provided payload."""
+    """Return a stable digest for the provided payload."""
 
     serialized = json.dumps(
         payload,
@@ -32,7 +40,7 @@ def _hash_payload(payload: Mapping[str, object]) -> str:
         separators=(",", ":"),
         sort_keys=True,
     ).encode("utf-8")
-    return sha256(serialized).hexdigest()
+    return _digest(serialized)
 
 
 def policy_version_hash(source: PolicyValidator | Sequence[ValidationResult]) -> str:
@@ -88,7 +96,7 @@ class ValidationSnapshot(BaseModel):
         }
         content_hash = _hash_payload(payload)
         chain_input = f"{self.previous_hash or ''}{content_hash}"
-        chain_hash = sha256(chain_input.encode("utf-8")).hexdigest()
+        chain_hash = _digest(chain_input.encode("utf-8"))
 
         object.__setattr__(self, "snapshot_hash", content_hash)
         object.__setattr__(self, "chain_hash", chain_hash)
@@ -144,10 +152,13 @@ class ValidationSnapshotStore:
         return self.base_path / trip_id
 
     def last_chain_hash(self, trip_id: str) -> str | None:
-        snapshots = self.load_trip_snapshots(trip_id)
-        if not snapshots:
+        trip_path = self._trip_path(trip_id)
+        if not trip_path.exists():
+            return None
+        latest = max(trip_path.glob("*.json"), default=None)
+        if latest is None:
             return None
-        return snapshots[-1].chain_hash
+        return self.load_snapshot(latest).chain_hash
 
     def load_trip_snapshots(self, trip_id: str) -> list[ValidationSnapshot]:
         trip_path = self._trip_path(trip_id)
@@ -159,8 +170,7 @@ class ValidationSnapshotStore:
         return snapshots
 
     def load_snapshot(self, path: str | Path) -> ValidationSnapshot:
-        data = json.loads(Path(path).read_text(encoding="utf-8"))
-        return ValidationSnapshot.model_validate(data)
+        return ValidationSnapshot.model_validate_json(Path(path).read_bytes())
 
     def append(self, snapshot: ValidationSnapshot) -> Path:
         trip_path = self._trip_path(snapshot.trip_id)
@@ -1,20 +1,89 @@
-"""Test configuration for adding src to the import path."""
+"""Shared test configuration: src import path and session fixtures."""
 
 from __future__ import annotations
 
+import shutil
+import subprocess
 import sys
+from collections.abc import Iterator
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
+from openpyxl import Workbook, load_workbook
 
 ROOT = Path(__file__).resolve().parents[2]
 SRC_PATH = ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
+if TYPE_CHECKING:
+    from travel_plan_permission import TripPlan
+    from travel_plan_permission.policy import PolicyEngine
+
 
 @pytest.fixture(autouse=True)
 def isolated_portal_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     """Keep default HTTP service state isolated across parallel test workers."""
 
     monkeypatch.setenv("TPP_PORTAL_STATE_PATH", str(tmp_path / "portal-runtime-state.sqlite3"))
+
+
+@pytest.fixture(scope="session")
+def markdown_lint_result() -> subprocess.CompletedProcess[str]:
+    """Run markdownlint-cli2 over the policy API docs once per test session."""
+
+    local_bin = ROOT / "node_modules" / ".bin" / "markdownlint-cli2"
+    lint_bin = local_bin if local_bin.exists() else shutil.which("markdownlint-cli2")
+    if not lint_bin:
+        pytest.skip("markdownlint-cli2 is not installed")
+
+    return subprocess.run(
+        [str(lint_bin), "docs/policy-api.md"],
+        check=False,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_policy_engine() -> PolicyEngine:
+    """Parse the bundled policy configuration once per test session."""
+
+    from travel_plan_permission.policy import PolicyEngine
+
+    return PolicyEngine.from_file()
+
+
+@pytest.fixture(scope="session")
+def template_workbook() -> Iterator[Workbook]:
+    """Open the bundled travel request template read-only once per test session."""
+
+    from travel_plan_permission import policy_api
+
+    workbook = load_workbook(policy_api._default_template_path(), read_only=True, data_only=False)
+    yield workbook
+    workbook.close()
+
+
+@pytest.fixture(scope="session")
+def base_plan() -> TripPlan:
+    """Session-wide plan for spreadsheet and policy helper tests."""
+
+    from travel_plan_permission import ExpenseCategory, TripPlan
+
+    return TripPlan(
+        trip_id="TRIP-HELP-001",
+        traveler_name="Taylor Morgan",
+        department="FIN",
+        destination="Austin, TX 78701",
+        departure_date=date(2024, 9, 15),
+        return_date=date(2024, 9, 20),
+        purpose="Planning session",
+        transportation_mode="air",
+        estimated_cost=Decimal("1500.00"),
+        expense_breakdown={ExpenseCategory.CONFERENCE_FEES: Decimal("0")},
+    )
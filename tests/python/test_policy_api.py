@@ -1,8 +1,8 @@
-import shutil
+import functools
 import subprocess
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
-from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -39,8 +39,84 @@ from travel_plan_permission import (
     submit_proposal,
 )
 
+_TRIP_PLAN_DOC_PAYLOAD: dict[str, Any] = {
+    "trip_id": "TRIP-1001",
+    "traveler_name": "Alex Rivera",
+    "traveler_role": "Senior Analyst",
+    "department": "Finance",
+    "destination": "Chicago, IL 60601",
+    "origin_city": "Austin, TX",
+    "destination_city": "Chicago, IL",
+    "departure_date": "2025-06-10",
+    "return_date": "2025-06-12",
+    "purpose": "Quarterly planning summit",
+    "transportation_mode": "air",
+    "expected_costs": {"airfare": 420.50, "lodging": 600.00},
+    "funding_source": "FIN-OPS",
+    "estimated_cost": 1200.50,
+    "status": "submitted",
+    "expense_breakdown": {"airfare": 420.50, "lodging": 600.00, "meals": 180.00},
+    "selected_providers": {"airfare": "Skyway Air", "lodging": "Lakeside Hotel"},
+    "validation_results": [],
+    "approval_history": [],
+    "exception_requests": [],
+}
+
+_POLICY_RESULT_DOC_PAYLOAD: dict[str, Any] = {
+    "status": "fail",
+    "issues": [
+        {
+            "code": "advance_booking",
+            "message": "Flights must be booked 14 days in advance",
+            "severity": "warning",
+            "context": {"rule_id": "advance_booking", "severity": "advisory"},
+        }
+    ],
+    "policy_version": "d7a6d25a",
+}
+
+_RECON_DOC_PAYLOAD: dict[str, Any] = {
+    "trip_id": "TRIP-1004",
+    "report_id": "TRIP-1004-reconciliation",
+    "planned_total": 900.00,
+    "actual_total": 325.25,
+    "variance": -574.75,
+    "status": "under_budget",
+    "receipt_count": 2,
+    "receipts_by_type": {".pdf": 1, ".png": 1},
+    "expenses_by_category": {"other": 325.25},
+}
+
+
+@functools.cache
+def _doc_trip_plan() -> TripPlan:
+    return TripPlan.model_validate(_TRIP_PLAN_DOC_PAYLOAD)
+
+
+@functools.cache
+def _doc_policy_result() -> PolicyCheckResult:
+    return PolicyCheckResult.model_validate(_POLICY_RESULT_DOC_PAYLOAD)
+
 
-@pytest.fixture()
+@functools.cache
+def _doc_reconciliation() -> ReconciliationResult:
+    return ReconciliationResult.model_validate(_RECON_DOC_PAYLOAD)
+
+
+@pytest.fixture(autouse=True)
+def _use_default_policy_engine(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    default_policy_engine: PolicyEngine,
+) -> None:
+    """Serve the session-cached default engine instead of re-reading policy.yaml."""
+
+    if request.node.get_closest_marker("custom_engine"):
+        return
+    monkeypatch.setattr(PolicyEngine, "from_file", lambda *_args, **_kwargs: default_policy_engine)
+
+
+@pytest.fixture(scope="session")
 def trip_plan() -> TripPlan:
     return TripPlan(
         trip_id="TRIP-API-001",
@@ -53,7 +129,7 @@ def trip_plan() -> TripPlan:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def over_budget_receipts() -> list[Receipt]:
     return [
         Receipt(
@@ -73,7 +149,7 @@ def over_budget_receipts() -> list[Receipt]:
     ]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def matching_receipts() -> list[Receipt]:
     return [
         Receipt(
@@ -93,21 +169,28 @@ def matching_receipts() -> list[Receipt]:
     ]
 
 
-def test_check_trip_plan_reports_policy_issues(trip_plan: TripPlan) -> None:
-    result = check_trip_plan(trip_plan)
+@pytest.fixture(scope="session")
+def over_budget_reconciliation(
+    trip_plan: TripPlan, over_budget_receipts: list[Receipt]
+) -> ReconciliationResult:
+    return reconcile(trip_plan, over_budget_receipts)
 
-    assert isinstance(result, PolicyCheckResult)
-    assert result.policy_version
-    assert result.status == "fail"
-    assert any(issue.code == "fare_evidence" for issue in result.issues)
-    for issue in result.issues:
-        assert issue.context["rule_id"] == issue.code
 
+@pytest.fixture(scope="session")
+def matching_reconciliation(
+    trip_plan: TripPlan, matching_receipts: list[Receipt]
+) -> ReconciliationResult:
+    return reconcile(trip_plan, matching_receipts)
 
-def test_check_trip_plan_triggers_fare_comparison_when_inputs_present(
-    trip_plan: TripPlan,
-) -> None:
-    plan = trip_plan.model_copy(
+
+@pytest.fixture(scope="session")
+def empty_reconciliation(trip_plan: TripPlan) -> ReconciliationResult:
+    return reconcile(trip_plan, [])
+
+
+@pytest.fixture(scope="session")
+def fare_comparison_plan(trip_plan: TripPlan) -> TripPlan:
+    return trip_plan.model_copy(
         update={
             "booking_date": date(2024, 8, 1),
             "departure_date": date(2024, 9, 15),
@@ -137,11 +220,27 @@ def test_check_trip_plan_triggers_fare_comparison_when_inputs_present(
         }
     )
 
-    result = check_trip_plan(plan)
+
+def test_check_trip_plan_reports_policy_issues(trip_plan: TripPlan) -> None:
+    result = check_trip_plan(trip_plan)
+
+    assert isinstance(result, PolicyCheckResult)
+    assert result.policy_version
+    assert result.status == "fail"
+    assert any(issue.code == "fare_evidence" for issue in result.issues)
+    for issue in result.issues:
+        assert issue.context["rule_id"] == issue.code
+
+
+def test_check_trip_plan_triggers_fare_comparison_when_inputs_present(
+    fare_comparison_plan: TripPlan,
+) -> None:
+    result = check_trip_plan(fare_comparison_plan)
 
     assert any(issue.code == "fare_comparison" for issue in result.issues)
 
 
+@pytest.mark.custom_engine
 def test_check_trip_plan_reports_pass_when_no_rules(
     trip_plan: TripPlan, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -154,6 +253,7 @@ def test_check_trip_plan_reports_pass_when_no_rules(
     assert result.policy_version
 
 
+@pytest.mark.custom_engine
 def test_check_trip_plan_passes_with_only_advisories(
     trip_plan: TripPlan, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -185,6 +285,7 @@ def test_check_trip_plan_passes_with_only_advisories(
     assert result.issues[0].severity == "warning"
 
 
+@pytest.mark.custom_engine
 def test_check_trip_plan_fails_with_blocking_and_advisory_rules(
     trip_plan: TripPlan, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -228,12 +329,14 @@ def test_check_trip_plan_fails_with_blocking_and_advisory_rules(
     result = check_trip_plan(trip_plan)
 
     assert result.status == "fail"
-    assert {issue.code for issue in result.issues} == {"blocking_rule", "advisory_rule"}
     severities = {issue.code: issue.severity for issue in result.issues}
+    assert sorted(severities) == ["advisory_rule", "blocking_rule"]
+    assert len(severities) == len(result.issues)
     assert severities["blocking_rule"] == "error"
     assert severities["advisory_rule"] == "warning"
 
 
+@pytest.mark.custom_engine
 def test_check_trip_plan_passes_when_all_rules_pass(
     trip_plan: TripPlan, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -339,9 +442,9 @@ def test_list_allowed_vendors_handles_no_active_providers(
 
 
 def test_reconcile_summarizes_receipts(
-    trip_plan: TripPlan, over_budget_receipts: list[Receipt]
+    over_budget_reconciliation: ReconciliationResult,
 ) -> None:
-    result = reconcile(trip_plan, over_budget_receipts)
+    result = over_budget_reconciliation
 
     assert result.status == "over_budget"
     assert result.planned_total == Decimal("1000.00")
@@ -353,17 +456,19 @@ def test_reconcile_summarizes_receipts(
 
 
 def test_reconcile_matches_estimated_cost(
-    trip_plan: TripPlan, matching_receipts: list[Receipt]
+    matching_reconciliation: ReconciliationResult,
 ) -> None:
-    result = reconcile(trip_plan, matching_receipts)
+    result = matching_reconciliation
 
     assert isinstance(result, ReconciliationResult)
     assert result.status == "on_budget"
     assert result.variance == Decimal("0.00")
 
 
-def test_reconcile_handles_empty_receipts(trip_plan: TripPlan) -> None:
-    result = reconcile(trip_plan, [])
+def test_reconcile_handles_empty_receipts(
+    empty_reconciliation: ReconciliationResult,
+) -> None:
+    result = empty_reconciliation
 
     assert result.status == "under_budget"
     assert result.planned_total == Decimal("1000.00")
@@ -374,78 +479,24 @@ def test_reconcile_handles_empty_receipts(trip_plan: TripPlan) -> None:
 
 
 def test_policy_api_documentation_examples_match_models() -> None:
-    trip_plan_payload = {
-        "trip_id": "TRIP-1001",
-        "traveler_name": "Alex Rivera",
-        "traveler_role": "Senior Analyst",
-        "department": "Finance",
-        "destination": "Chicago, IL 60601",
-        "origin_city": "Austin, TX",
-        "destination_city": "Chicago, IL",
-        "departure_date": "2025-06-10",
-        "return_date": "2025-06-12",
-        "purpose": "Quarterly planning summit",
-        "transportation_mode": "air",
-        "expected_costs": {"airfare": 420.50, "lodging": 600.00},
-        "funding_source": "FIN-OPS",
-        "estimated_cost": 1200.50,
-        "status": "submitted",
-        "expense_breakdown": {"airfare": 420.50, "lodging": 600.00, "meals": 180.00},
-        "selected_providers": {"airfare": "Skyway Air", "lodging": "Lakeside Hotel"},
-        "validation_results": [],
-        "approval_history": [],
-        "exception_requests": [],
-    }
-
-    plan = TripPlan.model_validate(trip_plan_payload)
+    plan = _doc_trip_plan()
     assert plan.trip_id == "TRIP-1001"
 
-    policy_result_payload = {
-        "status": "fail",
-        "issues": [
-            {
-                "code": "advance_booking",
-                "message": "Flights must be booked 14 days in advance",
-                "severity": "warning",
-                "context": {"rule_id": "advance_booking", "severity": "advisory"},
-            }
-        ],
-        "policy_version": "d7a6d25a",
-    }
-
-    policy_result = PolicyCheckResult.model_validate(policy_result_payload)
+    policy_result = _doc_policy_result()
     assert policy_result.status == "fail"
     assert policy_result.issues[0].code == "advance_booking"
 
-    reconciliation_payload = {
-        "trip_id": "TRIP-1004",
-        "report_id": "TRIP-1004-reconciliation",
-        "planned_total": 900.00,
-        "actual_total": 325.25,
-        "variance": -574.75,
-        "status": "under_budget",
-        "receipt_count": 2,
-        "receipts_by_type": {".pdf": 1, ".png": 1},
-        "expenses_by_category": {"other": 325.25},
-    }
-
-    reconciliation_result = ReconciliationResult.model_validate(reconciliation_payload)
+    reconciliation_result = _doc_reconciliation()
     assert reconciliation_result.receipt_count == 2
     assert reconciliation_result.status == "under_budget"
     assert ExpenseCategory.OTHER in reconciliation_result.expenses_by_category
 
 
-def test_policy_api_markdown_lint() -> None:
-    root = Path(__file__).resolve().parents[2]
-    local_bin = root / "node_modules" / ".bin" / "markdownlint-cli2"
-    lint_bin = local_bin if local_bin.exists() else shutil.which("markdownlint-cli2")
-    if not lint_bin:
-        pytest.skip("markdownlint-cli2 is not installed")
-
-    subprocess.run(
-        [str(lint_bin), "docs/policy-api.md"],
-        check=True,
-        cwd=root,
+def test_policy_api_markdown_lint(
+    markdown_lint_result: subprocess.CompletedProcess[str],
+) -> None:
+    assert markdown_lint_result.returncode == 0, (
+        markdown_lint_result.stdout + markdown_lint_result.stderr
     )
 
 
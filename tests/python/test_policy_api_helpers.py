@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import re
+import zipfile
 from datetime import date, datetime
 from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
+from xml.etree import ElementTree
 
 import pytest
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 
 import travel_plan_permission.policy_api as policy_api
 from travel_plan_permission import ExpenseCategory, Receipt, TripPlan
@@ -15,32 +19,116 @@ from travel_plan_permission.mapping import TemplateMapping
 from travel_plan_permission.policy import PolicyEngine, PolicyResult, Severity
 from travel_plan_permission.policy_versioning import PolicyVersion
 
-
-def _blank_template_bytes(initial_cells: dict[str, object] | None = None) -> bytes:
-    wb = Workbook()
-    ws = wb.active
-    for cell, value in (initial_cells or {}).items():
-        ws[cell] = value
+_D_50 = Decimal("50")
+_D_275_50 = Decimal("275.50")
+_D_18_75 = Decimal("18.75")
+_D_25 = Decimal("25")
+_D_120 = Decimal("120")
+_EMPTY_PATTERN = re.compile(r"^$")
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NESTED_INT = {"a": 1}
+_NESTED_STR = {"a": "value"}
+_NESTED_DICT = {"a": {"b": "value"}}
+_NESTED_LIST = {"a": {"b": [1]}}
+_NESTED_OBJ = {"a": {"b": [{"c": 3}]}}
+
+
+def _blank_template_bytes(initial_cells: tuple[tuple[str, object], ...] = ()) -> bytes:
+    """Return serialized xlsx bytes for a one-sheet workbook seeded with cells."""
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    if initial_cells:
+        rows: dict[int, dict[int, object]] = {}
+        for coordinate, value in initial_cells:
+            column_letter, row = coordinate_from_string(coordinate)
+            rows.setdefault(row, {})[column_index_from_string(column_letter)] = value
+        width = max(max(columns) for columns in rows.values())
+        for row in range(1, max(rows) + 1):
+            columns = rows.get(row, {})
+            ws.append([columns.get(column) for column in range(1, width + 1)])
     buffer = BytesIO()
     wb.save(buffer)
     wb.close()
     return buffer.getvalue()
 
 
-@pytest.fixture()
-def base_plan() -> TripPlan:
-    return TripPlan(
-        trip_id="TRIP-HELP-001",
-        traveler_name="Taylor Morgan",
-        department="FIN",
-        destination="Austin, TX 78701",
-        departure_date=date(2024, 9, 15),
-        return_date=date(2024, 9, 20),
-        purpose="Planning session",
-        transportation_mode="air",
-        estimated_cost=Decimal("1500.00"),
-        expense_breakdown={ExpenseCategory.CONFERENCE_FEES: Decimal("0")},
+def _never_exists(_path: Path) -> bool:
+    return False
+
+
+def _sheet_string_cells(xlsx: BinaryIO) -> dict[str, str]:
+    """Read string cells of the first sheet straight from the xlsx archive."""
+
+    with zipfile.ZipFile(xlsx) as archive:
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        shared = (
+            ElementTree.fromstring(archive.read("xl/sharedStrings.xml"))
+            if "xl/sharedStrings.xml" in archive.namelist()
+            else None
+        )
+    strings = (
+        ["".join(item.itertext()) for item in shared.iter(f"{_XLSX_NS}si")]
+        if shared is not None
+        else []
     )
+    cells: dict[str, str] = {}
+    for cell in sheet.iter(f"{_XLSX_NS}c"):
+        if cell.get("t") == "inlineStr":
+            cells[cell.attrib["r"]] = "".join(cell.itertext())
+        elif cell.get("t") == "s":
+            cells[cell.attrib["r"]] = strings[int(cell.findtext(f"{_XLSX_NS}v", "0"))]
+    return cells
+
+
+class _FakeSheet:
+    """Dict-backed worksheet that records cell assignments."""
+
+    def __init__(self) -> None:
+        self.cells: dict[str, object] = {}
+
+    def __setitem__(self, coordinate: str, value: object) -> None:
+        self.cells[coordinate] = value
+
+
+class _FakeWorkbook:
+    def __init__(self) -> None:
+        self.active = _FakeSheet()
+
+    def save(self, _target: object) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_sheet(monkeypatch: pytest.MonkeyPatch) -> _FakeSheet:
+    """Route fill_travel_spreadsheet through a fake workbook instead of openpyxl."""
+
+    workbook = _FakeWorkbook()
+    monkeypatch.setattr(policy_api, "_default_template_bytes", lambda *_args, **_kwargs: b"")
+    monkeypatch.setattr(policy_api, "load_workbook", lambda *_args, **_kwargs: workbook)
+    return workbook.active
+
+
+class _FakeResource:
+    """Stand-in for an ``importlib.resources`` traversable serving one payload."""
+
+    def __init__(self, payload: bytes = b"", *, raise_on_read: bool = False) -> None:
+        self._payload = payload
+        self._raise_on_read = raise_on_read
+
+    def joinpath(self, *_parts: str) -> _FakeResource:
+        return self
+
+    def is_file(self) -> bool:
+        return True
+
+    def read_bytes(self) -> bytes:
+        if self._raise_on_read:
+            raise AssertionError("Expected cached path to be used.")
+        return self._payload
 
 
 def test_default_template_path_reports_package_resource_only(
@@ -48,18 +136,8 @@ def test_default_template_path_reports_package_resource_only(
 ) -> None:
     template_bytes = b"template-bytes"
 
-    class FakeResource:
-        def joinpath(self, *_parts: str) -> FakeResource:
-            return self
-
-        def is_file(self) -> bool:
-            return True
-
-        def read_bytes(self) -> bytes:
-            return template_bytes
-
-    monkeypatch.setattr(Path, "exists", lambda _self: False)
-    monkeypatch.setattr(policy_api.resources, "files", lambda _name: FakeResource())
+    monkeypatch.setattr(policy_api, "_template_exists", _never_exists)
+    monkeypatch.setattr(policy_api.resources, "files", lambda _name: _FakeResource(template_bytes))
 
     template_path = policy_api._default_template_path("missing-template.xlsx")
     assert template_path.name == "missing-template.xlsx"
@@ -73,32 +151,18 @@ def test_default_template_path_uses_cached_resource(
     cached_path = tmp_path / template_name
     cached_path.write_bytes(b"cached")
 
-    class FakeResource:
-        def joinpath(self, *_parts: str) -> FakeResource:
-            return self
-
-        def is_file(self) -> bool:
-            return True
-
-        def read_bytes(self) -> bytes:
-            raise AssertionError("Expected cached path to be used.")
-
-    original_cache = dict(policy_api._RESOURCE_TEMPLATE_CACHE)
-    policy_api._RESOURCE_TEMPLATE_CACHE.clear()
-    policy_api._RESOURCE_TEMPLATE_CACHE[template_name] = cached_path
+    monkeypatch.setattr(policy_api, "_RESOURCE_TEMPLATE_CACHE", {template_name: cached_path})
 
     def fake_exists(path: Path) -> bool:
         return path == cached_path
 
-    monkeypatch.setattr(Path, "exists", fake_exists)
-    monkeypatch.setattr(policy_api.resources, "files", lambda _name: FakeResource())
+    monkeypatch.setattr(policy_api, "_template_exists", fake_exists)
+    monkeypatch.setattr(
+        policy_api.resources, "files", lambda _name: _FakeResource(raise_on_read=True)
+    )
 
-    try:
-        template_path = policy_api._default_template_path(template_name)
-        assert template_path == cached_path
-    finally:
-        policy_api._RESOURCE_TEMPLATE_CACHE.clear()
-        policy_api._RESOURCE_TEMPLATE_CACHE.update(original_cache)
+    template_path = policy_api._default_template_path(template_name)
+    assert template_path == cached_path
 
 
 def test_default_template_bytes_reads_package_resource(
@@ -106,26 +170,23 @@ def test_default_template_bytes_reads_package_resource(
 ) -> None:
     template_bytes = b"template-bytes"
 
-    class FakeResource:
-        def joinpath(self, *_parts: str) -> FakeResource:
-            return self
+    monkeypatch.setattr(policy_api, "_template_exists", _never_exists)
+    monkeypatch.setattr(policy_api.resources, "files", lambda _name: _FakeResource(template_bytes))
 
-        def is_file(self) -> bool:
-            return True
+    assert policy_api._default_template_bytes("missing-template.xlsx") == template_bytes
 
-        def read_bytes(self) -> bytes:
-            return template_bytes
 
-    monkeypatch.setattr(Path, "exists", lambda _self: False)
-    monkeypatch.setattr(policy_api.resources, "files", lambda _name: FakeResource())
+def test_default_template_bytes_reuses_unchanged_template_file() -> None:
+    first = policy_api._default_template_bytes()
 
-    assert policy_api._default_template_bytes("missing-template.xlsx") == template_bytes
+    assert policy_api._default_template_bytes() is first
+    assert first.startswith(b"PK")
 
 
 def test_default_template_bytes_missing_package_module(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr(Path, "exists", lambda _self: False)
+    monkeypatch.setattr(policy_api, "_template_exists", _never_exists)
 
     def _raise_module_error(_name: str):
         raise ModuleNotFoundError
@@ -139,7 +200,7 @@ def test_default_template_bytes_missing_package_module(
 def test_split_destination_returns_original_when_pattern_misses(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr(policy_api, "_ZIP_PATTERN", re.compile(r"^$"))
+    monkeypatch.setattr(policy_api, "_ZIP_PATTERN", _EMPTY_PATTERN)
 
     city_state, zip_code = policy_api._split_destination("Nowhere Land 99999")
 
@@ -147,28 +208,48 @@ def test_split_destination_returns_original_when_pattern_misses(
     assert zip_code is None
 
 
-def test_resolve_field_value_handles_nested_variations() -> None:
-    assert policy_api._resolve_field_value({"a": 1}, "a") == 1
-    assert policy_api._resolve_field_value({"a": 1}, "bad[") is None
-    assert policy_api._resolve_field_value({"a": "value"}, "a.b") is None
-    assert policy_api._resolve_field_value({"a": {"b": "value"}}, "a.b[0]") is None
-    assert policy_api._resolve_field_value({"a": {"b": [1]}}, "a.b[2]") is None
-    assert policy_api._resolve_field_value({"a": {"b": [{"c": 3}]}}, "a.b[0].c") == 3
-
-
-def test_format_date_value_variants() -> None:
-    assert policy_api._format_date_value(datetime(2024, 1, 2, 9, 30)) == "2024-01-02"
-    assert policy_api._format_date_value(date(2024, 2, 3)) == "2024-02-03"
-    assert policy_api._format_date_value("2024-03-04") == "2024-03-04"
-    assert policy_api._format_date_value(123) is None
-
-
-def test_format_currency_value_variants() -> None:
-    assert policy_api._format_currency_value(None) is None
-    assert policy_api._format_currency_value(10) == Decimal("10.00")
-    assert policy_api._format_currency_value(12.5) == Decimal("12.50")
-    assert policy_api._format_currency_value("oops") is None
-    assert policy_api._format_currency_value(object()) is None
+@pytest.mark.parametrize(
+    ("data", "path", "expected"),
+    [
+        (_NESTED_INT, "a", 1),
+        (_NESTED_INT, "bad[", None),
+        (_NESTED_STR, "a.b", None),
+        (_NESTED_DICT, "a.b[0]", None),
+        (_NESTED_LIST, "a.b[2]", None),
+        (_NESTED_OBJ, "a.b[0].c", 3),
+    ],
+)
+def test_resolve_field_value_handles_nested_variations(
+    data: dict[str, object], path: str, expected: object
+) -> None:
+    assert policy_api._resolve_field_value(data, path) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (datetime(2024, 1, 2, 9, 30), "2024-01-02"),
+        (date(2024, 2, 3), "2024-02-03"),
+        ("2024-03-04", "2024-03-04"),
+        (123, None),
+    ],
+)
+def test_format_date_value_variants(value: object, expected: str | None) -> None:
+    assert policy_api._format_date_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        (10, Decimal("10.00")),
+        (12.5, Decimal("12.50")),
+        ("oops", None),
+        (object(), None),
+    ],
+)
+def test_format_currency_value_variants(value: object, expected: Decimal | None) -> None:
+    assert policy_api._format_currency_value(value) == expected
 
 
 def test_issue_severity_reports_info() -> None:
@@ -183,7 +264,7 @@ def test_issue_severity_reports_info() -> None:
 
 
 def test_fill_travel_spreadsheet_sets_dropdown_checkbox_and_formula(
-    base_plan: TripPlan, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    base_plan: TripPlan, monkeypatch: pytest.MonkeyPatch, fake_sheet: _FakeSheet
 ) -> None:
     mapping = TemplateMapping(
         version="ITIN-2025.1",
@@ -193,29 +274,22 @@ def test_fill_travel_spreadsheet_sets_dropdown_checkbox_and_formula(
         formulas={"total": {"cell": "D1", "formula": "=1+1"}},
         metadata={},
     )
-    template_bytes = _blank_template_bytes()
 
     monkeypatch.setattr(policy_api, "load_template_mapping", lambda: mapping)
-    monkeypatch.setattr(
-        policy_api,
-        "_default_template_bytes",
-        lambda *_args, **_kwargs: template_bytes,
-    )
 
-    output_path = tmp_path / "dropdowns.xlsx"
-    policy_api.fill_travel_spreadsheet(base_plan, output_path)
+    output = BytesIO()
+    assert policy_api.fill_travel_spreadsheet(base_plan, output) is output
 
-    workbook = load_workbook(output_path)
-    sheet = workbook.active
-    assert sheet["A1"].value == base_plan.traveler_name
-    assert sheet["B1"].value == base_plan.transportation_mode
-    assert sheet["C1"].value == "Y"
-    assert sheet["D1"].value == "=1+1"
-    workbook.close()
+    assert fake_sheet.cells == {
+        "A1": base_plan.traveler_name,
+        "B1": base_plan.transportation_mode,
+        "C1": "Y",
+        "D1": "=1+1",
+    }
 
 
 def test_fill_travel_spreadsheet_skips_invalid_currency_and_date(
-    base_plan: TripPlan, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    base_plan: TripPlan, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     mapping = TemplateMapping(
         version="ITIN-2025.1",
@@ -225,7 +299,7 @@ def test_fill_travel_spreadsheet_skips_invalid_currency_and_date(
         formulas={},
         metadata={},
     )
-    template_bytes = _blank_template_bytes({"B2": "keep", "C2": "keep"})
+    template_bytes = _blank_template_bytes((("B2", "keep"), ("C2", "keep")))
 
     monkeypatch.setattr(policy_api, "load_template_mapping", lambda: mapping)
     monkeypatch.setattr(
@@ -242,18 +316,17 @@ def test_fill_travel_spreadsheet_skips_invalid_currency_and_date(
         },
     )
 
-    output_path = tmp_path / "skips.xlsx"
-    policy_api.fill_travel_spreadsheet(base_plan, output_path)
+    output = BytesIO()
+    policy_api.fill_travel_spreadsheet(base_plan, output)
+    output.seek(0)
 
-    workbook = load_workbook(output_path)
-    sheet = workbook.active
-    assert sheet["B2"].value == "keep"
-    assert sheet["C2"].value == "keep"
-    workbook.close()
+    cells = _sheet_string_cells(output)
+    assert cells["B2"] == "keep"
+    assert cells["C2"] == "keep"
 
 
 def test_fill_travel_spreadsheet_reports_unfilled_mappings(
-    base_plan: TripPlan, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    base_plan: TripPlan, monkeypatch: pytest.MonkeyPatch, fake_sheet: _FakeSheet
 ) -> None:
     mapping = TemplateMapping(
         version="ITIN-2025.1",
@@ -273,14 +346,8 @@ def test_fill_travel_spreadsheet_reports_unfilled_mappings(
         formulas={},
         metadata={},
     )
-    template_bytes = _blank_template_bytes()
 
     monkeypatch.setattr(policy_api, "load_template_mapping", lambda: mapping)
-    monkeypatch.setattr(
-        policy_api,
-        "_default_template_bytes",
-        lambda *_args, **_kwargs: template_bytes,
-    )
     monkeypatch.setattr(
         policy_api,
         "_plan_field_values",
@@ -290,10 +357,11 @@ def test_fill_travel_spreadsheet_reports_unfilled_mappings(
         },
     )
 
-    output_path = tmp_path / "unfilled.xlsx"
+    output = BytesIO()
     report = policy_api.UnfilledMappingReport()
-    policy_api.fill_travel_spreadsheet(base_plan, output_path, report=report)
+    policy_api.fill_travel_spreadsheet(base_plan, output, report=report)
 
+    assert fake_sheet.cells == {"A1": "Taylor Morgan"}
     cell_entries = {(entry.field, entry.reason) for entry in report.cells}
     assert ("hotel.name", "missing") in cell_entries
     assert ("event_registration_cost", "invalid_currency") in cell_entries
@@ -310,9 +378,9 @@ def test_plan_field_values_includes_cost_center_and_destination(
             "funding_source": "OPS-42",
             "destination": "Denver, CO 80202",
             "expense_breakdown": {
-                ExpenseCategory.CONFERENCE_FEES: Decimal("50"),
-                ExpenseCategory.AIRFARE: Decimal("275.50"),
-                ExpenseCategory.GROUND_TRANSPORT: Decimal("18.75"),
+                ExpenseCategory.CONFERENCE_FEES: _D_50,
+                ExpenseCategory.AIRFARE: _D_275_50,
+                ExpenseCategory.GROUND_TRANSPORT: _D_18_75,
             },
         }
     )
@@ -326,18 +394,18 @@ def test_plan_field_values_includes_cost_center_and_destination(
     assert fields["destination_zip"] == "80202"
     assert fields["depart_date"] == plan.departure_date
     assert fields["return_date"] == plan.return_date
-    assert fields["event_registration_cost"] == Decimal("50")
-    assert fields["flight_pref_outbound.roundtrip_cost"] == Decimal("275.50")
-    assert fields["lowest_cost_roundtrip"] == Decimal("275.50")
-    assert fields["parking_estimate"] == Decimal("18.75")
+    assert fields["event_registration_cost"] == _D_50
+    assert fields["flight_pref_outbound.roundtrip_cost"] == _D_275_50
+    assert fields["lowest_cost_roundtrip"] == _D_275_50
+    assert fields["parking_estimate"] == _D_18_75
 
 
 def test_context_from_plan_maps_costs(base_plan: TripPlan) -> None:
     plan = base_plan.model_copy(
         update={
             "expense_breakdown": {
-                ExpenseCategory.GROUND_TRANSPORT: Decimal("25"),
-                ExpenseCategory.AIRFARE: Decimal("120"),
+                ExpenseCategory.GROUND_TRANSPORT: _D_25,
+                ExpenseCategory.AIRFARE: _D_120,
             }
         }
     )
@@ -346,8 +414,8 @@ def test_context_from_plan_maps_costs(base_plan: TripPlan) -> None:
 
     assert context.departure_date == plan.departure_date
     assert context.return_date == plan.return_date
-    assert context.driving_cost == Decimal("25")
-    assert context.flight_cost == Decimal("120")
+    assert context.driving_cost == _D_25
+    assert context.flight_cost == _D_120
 
 
 def test_policy_version_hash_matches_engine_rules() -> None:
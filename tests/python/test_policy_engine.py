@@ -9,16 +9,40 @@ from travel_plan_permission import (
     Severity,
 )
 
+_EXPECTED_RULE_IDS = frozenset(
+    {
+        "advance_booking",
+        "fare_comparison",
+        "cabin_class",
+        "fare_evidence",
+        "driving_vs_flying",
+        "hotel_comparison",
+        "local_overnight",
+        "meal_per_diem",
+        "non_reimbursable",
+        "third_party_paid",
+    }
+)
+_EXPECTED_BLOCKING = frozenset(
+    {
+        "fare_comparison",
+        "cabin_class",
+        "fare_evidence",
+        "non_reimbursable",
+        "third_party_paid",
+    }
+)
+
 
 def test_policy_engine_evaluates_all_rules():
-    yaml_content = """
-rules:
-  advance_booking:
-    days_required: 10
-  fare_comparison:
-    max_over_lowest: 150
-"""
-    engine = PolicyEngine.from_yaml(yaml_content)
+    engine = PolicyEngine.from_dict(
+        {
+            "rules": {
+                "advance_booking": {"days_required": 10},
+                "fare_comparison": {"max_over_lowest": 150},
+            }
+        }
+    )
     context = PolicyContext(
         booking_date=date(2025, 1, 1),
         departure_date=date(2025, 1, 5),
@@ -47,18 +71,7 @@ rules:
     )
 
     results = {result.rule_id: result for result in engine.validate(context)}
-    assert set(results.keys()) == {
-        "advance_booking",
-        "fare_comparison",
-        "cabin_class",
-        "fare_evidence",
-        "driving_vs_flying",
-        "hotel_comparison",
-        "local_overnight",
-        "meal_per_diem",
-        "non_reimbursable",
-        "third_party_paid",
-    }
+    assert results.keys() == _EXPECTED_RULE_IDS
 
     assert not results["advance_booking"].passed
     assert not results["fare_comparison"].passed
@@ -71,20 +84,14 @@ rules:
     assert not results["non_reimbursable"].passed
     assert not results["third_party_paid"].passed
 
-    blocking = engine.blocking_results(context)
+    blocking = tuple(engine.blocking_results(context))
     blocking_ids = {result.rule_id for result in blocking}
-    assert blocking_ids == {
-        "fare_comparison",
-        "cabin_class",
-        "fare_evidence",
-        "non_reimbursable",
-        "third_party_paid",
-    }
+    assert blocking_ids == _EXPECTED_BLOCKING
     assert all(result.severity == Severity.BLOCKING for result in blocking)
 
 
-def test_policy_engine_from_file_defaults():
-    engine = PolicyEngine.from_file()
+def test_policy_engine_from_file_defaults(default_policy_engine):
+    engine = default_policy_engine
     context = PolicyContext(
         booking_date=date(2025, 1, 1),
         departure_date=date(2025, 1, 20),
@@ -119,13 +126,14 @@ def test_policy_engine_from_file_defaults():
 
 
 def test_policy_messages_include_thresholds_from_config():
-    engine = PolicyEngine.from_yaml("""
-rules:
-  advance_booking:
-    days_required: 21
-  fare_comparison:
-    max_over_lowest: 175
-""")
+    engine = PolicyEngine.from_dict(
+        {
+            "rules": {
+                "advance_booking": {"days_required": 21},
+                "fare_comparison": {"max_over_lowest": 175},
+            }
+        }
+    )
 
     context = PolicyContext(
         booking_date=date(2025, 1, 1),
@@ -143,3 +151,23 @@ rules:
     fare = results["fare_comparison"]
     assert not fare.passed
     assert "175" in fare.message
+
+
+def test_policy_engine_from_yaml_matches_from_dict():
+    yaml_engine = PolicyEngine.from_yaml("""
+rules:
+  advance_booking:
+    days_required: 21
+  fare_comparison:
+    max_over_lowest: 175
+""")
+    dict_engine = PolicyEngine.from_dict(
+        {
+            "rules": {
+                "advance_booking": {"days_required": 21},
+                "fare_comparison": {"max_over_lowest": 175},
+            }
+        }
+    )
+
+    assert yaml_engine.describe_rules() == dict_engine.describe_rules()
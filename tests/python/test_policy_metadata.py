@@ -2,24 +2,20 @@ from travel_plan_permission import PolicyEngine
 
 
 def test_describe_rules_reflects_configuration() -> None:
-    yaml_content = """
-rules:
-  advance_booking:
-    days_required: 21
-    severity: blocking
-  fare_comparison:
-    max_over_lowest: 150
-  cabin_class:
-    long_haul_hours: 6
-    allowed_classes:
-      - economy
-      - premium economy
-    severity: advisory
-  non_reimbursable:
-    blocked_keywords:
-      - gift
-"""
-    engine = PolicyEngine.from_yaml(yaml_content)
+    engine = PolicyEngine.from_dict(
+        {
+            "rules": {
+                "advance_booking": {"days_required": 21, "severity": "blocking"},
+                "fare_comparison": {"max_over_lowest": 150},
+                "cabin_class": {
+                    "long_haul_hours": 6,
+                    "allowed_classes": ["economy", "premium economy"],
+                    "severity": "advisory",
+                },
+                "non_reimbursable": {"blocked_keywords": ["gift"]},
+            }
+        }
+    )
     metadata = {item["rule_id"]: item for item in engine.describe_rules()}
 
     assert metadata["advance_booking"]["severity"] == "blocking"
@@ -1,7 +1,3 @@
-import sys
-
-sys.path.append("src")
-
 from travel_plan_permission.policy import PolicyContext, PolicyEngine, PolicyResult
 from travel_plan_permission.policy_versioning import (
     PolicyChangeSimulationResult,
@@ -11,6 +7,11 @@ from travel_plan_permission.policy_versioning import (
     simulate_policy_change,
 )
 
+_EMPTY_CTX = PolicyContext()
+_CONTEXTS = (_EMPTY_CTX, _EMPTY_CTX)
+_CURRENT_RESULTS = (PolicyResult(rule_id="test", severity="advisory", passed=True, message="old"),)
+_PROPOSED_RESULTS = (PolicyResult(rule_id="test", severity="advisory", passed=True, message="new"),)
+
 
 def test_policy_version_hash_and_label() -> None:
     version = PolicyVersion.from_config("1.2.3", {"rules": {"foo": 1}})
@@ -57,21 +58,13 @@ class _StaticEngine(PolicyEngine):
 
 
 def test_simulation_replays_contexts() -> None:
-    contexts = [PolicyContext(), PolicyContext()]
-    current_results: list[PolicyResult] = [
-        PolicyResult(rule_id="test", severity="advisory", passed=True, message="old")
-    ]
-    proposed_results: list[PolicyResult] = [
-        PolicyResult(rule_id="test", severity="advisory", passed=True, message="new")
-    ]
-
     simulations = simulate_policy_change(
-        current_engine=_StaticEngine(current_results),
-        proposed_engine=_StaticEngine(proposed_results),
-        historical_contexts=contexts,
+        current_engine=_StaticEngine(list(_CURRENT_RESULTS)),
+        proposed_engine=_StaticEngine(list(_PROPOSED_RESULTS)),
+        historical_contexts=_CONTEXTS,
     )
 
-    assert len(simulations) == len(contexts)
+    assert len(simulations) == len(_CONTEXTS)
     assert all(isinstance(item, PolicyChangeSimulationResult) for item in simulations)
-    assert all(sim.current_results == current_results for sim in simulations)
-    assert all(sim.proposed_results == proposed_results for sim in simulations)
+    assert all(sim.current_results == list(_CURRENT_RESULTS) for sim in simulations)
+    assert all(sim.proposed_results == list(_PROPOSED_RESULTS) for sim in simulations)
@@ -16,6 +16,16 @@ def test_generate_questions_limits_to_ten_and_skips_answered():
     assert all("Who is traveling" not in prompt for prompt in prompts)
 
 
+def test_generate_questions_treats_blank_answers_as_missing():
+    answered = generate_questions({"traveler_name": "Ada Lovelace"}, max_questions=3)
+    blank = generate_questions({"traveler_name": ""}, max_questions=3)
+
+    assert blank[0].fields == ("traveler_name",)
+    assert answered[0].fields != ("traveler_name",)
+    assert generate_questions({"traveler_name": ""}, max_questions=3) == blank
+    assert generate_questions({"traveler_name": ""}, max_questions=3) is not blank
+
+
 def test_required_field_gaps_identifies_missing_fields():
     answers = {
         "traveler_name": "Ada Lovelace",
@@ -52,6 +62,53 @@ def test_output_bundle_includes_brochure_reference():
     assert b"%%EOF" in summary["content"][-2048:]
 
 
+def _assert_xref_matches_objects(pdf, object_count):
+    startxref = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+    assert pdf[startxref:].startswith(b"xref\n0 %d\n" % (object_count + 1))
+    entries = pdf[startxref:].split(b"\n")[3 : 3 + object_count]
+    for number, entry in enumerate(entries, start=1):
+        offset = int(entry[:10])
+        assert pdf[offset:].startswith(b"%d 0 obj\n" % number)
+
+
+def test_summary_pdf_escapes_text_and_indexes_objects():
+    pdf = prompt_flow._build_summary_pdf(
+        ["Travel Plan Summary", "Traveler: Ada (Countess) Lovelace", "Notes: C:\\temp"]
+    )
+
+    assert b"T* (Traveler: Ada \\(Countess\\) Lovelace) Tj" in pdf
+    assert b"T* (Notes: C:\\\\temp) Tj" in pdf
+
+    _assert_xref_matches_objects(pdf, object_count=8)
+
+
+def test_summary_pdf_paginates_long_summaries_and_keeps_non_latin_text():
+    name = "Traveler: 李雷 Zoë"
+    lines = ["Travel Plan Summary", name, *(f"Note {index}" for index in range(100))]
+
+    pdf = prompt_flow._build_summary_pdf(lines)
+
+    # 39 body lines fit under the title, then 41 per continuation page.
+    assert b"/Type /Pages /Kids [6 0 R 8 0 R 10 0 R] /Count 3" in pdf
+    _assert_xref_matches_objects(pdf, object_count=5 + 2 * 3 + 1)
+    assert b"?" not in pdf.split(b"stream\n", 1)[1].split(b"endstream", 1)[0]
+    actual_text = name.encode("utf-16-be").hex().upper().encode("ascii")
+    assert b"/Span << /ActualText <FEFF%b> >> BDC" % actual_text in pdf
+    assert b"(Traveler: ) Tj /F3 11 Tf (nn) Tj /F2 11 Tf ( Zo\xeb) Tj" in pdf
+    assert b"T* (Note 37) Tj\nET" in pdf
+    assert b"BT\n/F2 11 Tf\n16 TL\n72 736 Td\nT* (Note 38) Tj" in pdf
+
+
+def test_summary_pdf_renderer_reuses_static_prefix():
+    renderer = prompt_flow.SummaryPdfRenderer()
+    first = renderer.render(["Travel Plan Summary", "Traveler: Ada"])
+    second = renderer.render(["Travel Plan Summary", "Traveler: Grace Hopper"])
+
+    prefix_end = first.index(b"5 0 obj\n")
+    assert second[:prefix_end] == first[:prefix_end]
+    assert first == prompt_flow._build_summary_pdf(["Travel Plan Summary", "Traveler: Ada"])
+
+
 def test_output_bundle_uses_text_for_invalid_pdf(monkeypatch):
     answers = {"traveler_name": "Ada Lovelace", "city_state": "Boston, MA"}
     itinerary = b"excel-bytes"
@@ -67,3 +124,45 @@ def test_output_bundle_uses_text_for_invalid_pdf(monkeypatch):
     assert summary["filename"] == "summary.txt"
     assert summary["mime_type"] == "text/plain"
     assert b"Travel Plan Summary" in summary["content"]
+
+
+def test_conversation_log_json_keeps_stdlib_formatting():
+    conversation_log = [{"type": "question", "text": "Où allez-vous?", "turn": 1}]
+
+    bundle = build_output_bundle(
+        itinerary_excel=b"excel-bytes",
+        answers={"traveler_name": "Ada Lovelace"},
+        conversation_log=conversation_log,
+    )
+
+    assert bundle["conversation_log_json"] == (
+        '[{"type": "question", "text": "Où allez-vous?", "turn": 1}]'
+    )
+
+
+def test_output_bundle_uses_text_when_renderer_output_is_incomplete(monkeypatch):
+    class _TruncatingRenderer:
+        def render(self, summary_lines):
+            return prompt_flow.SummaryPdfRenderer().render(summary_lines)[:-64]
+
+    monkeypatch.setattr(prompt_flow, "_SUMMARY_PDF_RENDERER", _TruncatingRenderer())
+
+    bundle = build_output_bundle(
+        itinerary_excel=b"excel-bytes",
+        answers={"traveler_name": "Ada Lovelace"},
+    )
+
+    summary = bundle["summary_pdf"]
+    assert summary["filename"] == "summary.txt"
+    assert summary["content"].startswith(b"Travel Plan Summary\nTraveler: Ada Lovelace")
+
+
+def test_summary_pdf_wraps_and_truncates_long_titles():
+    title = "Regional Sales Kickoff and Partner Summit " * 4
+
+    pdf = prompt_flow._build_summary_pdf([title, "Traveler: Ada"])
+
+    assert b"/F1 18 Tf\n72 720 Td\n(Regional Sales Kickoff and Partner Summit) Tj\n" in pdf
+    assert b"0 -22 Td (Regional Sales Kickoff and Partner Summit) Tj\n" in pdf
+    assert b"0 -22 Td (Regional Sales Kickoff and Partner Summit ...) Tj\n" in pdf
+    assert pdf.count(b"0 -22 Td") == 2
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from datetime import date
+from pathlib import Path
 
 from travel_plan_permission.providers import ProviderRegistry, ProviderType
 
@@ -27,3 +29,124 @@ def test_registry_metadata_requires_approver_and_version() -> None:
     assert registry.version == "2024.09"
     assert registry.approver == "Travel Operations Manager"
     assert registry.change_log, "Change log should capture provider list updates"
+
+
+def test_from_file_reuses_parsed_registry_until_file_changes(tmp_path: Path) -> None:
+    source = ProviderRegistry.from_file("config/providers.yaml")
+    config_path = tmp_path / "providers.yaml"
+    content = Path("config/providers.yaml").read_text(encoding="utf-8")
+    config_path.write_text(content, encoding="utf-8")
+
+    first = ProviderRegistry.from_file(config_path)
+    assert first == source
+    first.providers.clear()
+    first.change_log.clear()
+
+    second = ProviderRegistry.from_file(config_path)
+    assert second is not first
+    assert second == source
+
+    config_path.write_text(
+        content.replace('version: "2024.09"\nupdated_at', 'version: "2024.10"\nupdated_at', 1),
+        encoding="utf-8",
+    )
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = ProviderRegistry.from_file(config_path)
+    assert reloaded is not first
+    assert reloaded.version == "2024.10"
+
+
+def test_lookup_orders_by_name_within_type_bucket() -> None:
+    registry = ProviderRegistry.model_validate(
+        {
+            "version": "test",
+            "approver": "Ops",
+            "updated_at": date(2024, 1, 1),
+            "providers": [
+                {
+                    "name": name,
+                    "type": provider_type,
+                    "contract_id": f"C-{index}",
+                    "valid_from": date(2024, 1, 1),
+                    "destinations": ["denver"],
+                }
+                for index, (name, provider_type) in enumerate(
+                    [
+                        ("zephyr hotel", "hotel"),
+                        ("Alpine Air", "airline"),
+                        ("Aspen Lodge", "hotel"),
+                        ("mile high inn", "hotel"),
+                    ]
+                )
+            ],
+        }
+    )
+
+    hotels = registry.lookup(ProviderType.HOTEL, "Denver, CO", reference_date=date(2024, 6, 1))
+
+    assert [provider.name for provider in hotels] == [
+        "Aspen Lodge",
+        "mile high inn",
+        "zephyr hotel",
+    ]
+    assert registry.lookup(ProviderType.GROUND_TRANSPORT, "Denver, CO") == []
+
+
+def test_lookup_excludes_contracts_outside_reference_date() -> None:
+    registry = ProviderRegistry.model_validate(
+        {
+            "version": "test",
+            "approver": "Ops",
+            "updated_at": date(2024, 1, 1),
+            "providers": [
+                {
+                    "name": name,
+                    "type": "airline",
+                    "contract_id": name,
+                    "valid_from": valid_from,
+                    "valid_to": valid_to,
+                }
+                for name, valid_from, valid_to in [
+                    ("Expired Air", date(2023, 1, 1), date(2023, 12, 31)),
+                    ("Current Air", date(2024, 1, 1), None),
+                    ("Future Air", date(2024, 7, 1), None),
+                ]
+            ],
+        }
+    )
+
+    names = [
+        provider.name
+        for provider in registry.lookup(
+            ProviderType.AIRLINE, "Anywhere", reference_date=date(2024, 6, 30)
+        )
+    ]
+
+    assert names == ["Current Air"]
+
+
+def test_lookup_reflects_replaced_and_edited_providers() -> None:
+    registry = ProviderRegistry.from_file("config/providers.yaml")
+    reference_date = date(2024, 6, 1)
+    assert registry.lookup(ProviderType.AIRLINE, "London, UK", reference_date=reference_date)
+
+    replacement = registry.providers[0].model_copy(
+        update={"name": "Replacement Air", "type": ProviderType.AIRLINE, "destinations": []}
+    )
+    copied = registry.model_copy(update={"providers": [replacement]})
+    assert copied.lookup(ProviderType.AIRLINE, "London, UK", reference_date=reference_date) == [
+        replacement
+    ]
+
+    registry.providers = []
+    assert registry.lookup(ProviderType.AIRLINE, "London, UK", reference_date=reference_date) == []
+
+    registry.providers.append(replacement)
+    assert registry.lookup(ProviderType.AIRLINE, "London, UK", reference_date=reference_date) == [
+        replacement
+    ]
+
+    registry.providers.clear()
+    assert registry.lookup(ProviderType.AIRLINE, "London, UK", reference_date=reference_date) == []
@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 
 
 def test_public_api_imports() -> None:
@@ -95,3 +101,56 @@ def test_public_api_imports() -> None:
     assert ReconciliationResult is not None
     assert ReconciliationStatus is not None
     assert Receipt is not None
+
+
+def test_public_api_exports_resolve_lazily() -> None:
+    """Every name in ``__all__`` should resolve through the lazy loader."""
+    travel_plan_permission = importlib.import_module("travel_plan_permission")
+    validation = importlib.import_module("travel_plan_permission.validation")
+
+    for name in travel_plan_permission.__all__:
+        assert getattr(travel_plan_permission, name) is not None
+
+    assert travel_plan_permission.ValidationAdvanceBookingRule is validation.AdvanceBookingRule
+    assert "TripPlan" in vars(travel_plan_permission)
+
+
+def test_public_api_unknown_attribute_raises() -> None:
+    travel_plan_permission = importlib.import_module("travel_plan_permission")
+
+    with pytest.raises(AttributeError, match="DoesNotExist"):
+        travel_plan_permission.DoesNotExist  # noqa: B018
+
+
+def test_public_api_dir_lists_lazy_exports() -> None:
+    travel_plan_permission = importlib.import_module("travel_plan_permission")
+
+    assert set(travel_plan_permission.__all__) <= set(dir(travel_plan_permission))
+
+
+def test_importing_a_model_skips_heavy_dependencies() -> None:
+    src_path = Path(__file__).resolve().parents[2] / "src"
+    probe = (
+        "import sys\n"
+        "from travel_plan_permission import TripPlan\n"
+        "print(sorted(m for m in ('openpyxl', 'reportlab', 'fastapi') if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(src_path)},
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("module", ["snapshots", "validation"])
+def test_submodules_import_first_in_fresh_interpreter(module: str) -> None:
+    src_path = Path(__file__).resolve().parents[2] / "src"
+    subprocess.run(
+        [sys.executable, "-c", f"import travel_plan_permission.{module}"],
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src_path)},
+    )
@@ -0,0 +1,78 @@
+import importlib.util
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+_SCRIPT_PATH = Path(__file__).resolve().parents[2] / "tools" / "resolve_mypy_pin.py"
+_SPEC = importlib.util.spec_from_file_location("resolve_mypy_pin", _SCRIPT_PATH)
+assert _SPEC is not None and _SPEC.loader is not None
+resolve_mypy_pin = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(resolve_mypy_pin)
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.chdir(tmp_path)
+    for name in ("MATRIX_PYTHON_VERSION", "MYPY_PYTHON_VERSION", "GITHUB_OUTPUT"):
+        monkeypatch.delenv(name, raising=False)
+    resolve_mypy_pin.get_mypy_python_version.cache_clear()
+    yield tmp_path
+    resolve_mypy_pin.get_mypy_python_version.cache_clear()
+
+
+def _write_pyproject(root: Path, python_version: str) -> None:
+    (root / "pyproject.toml").write_text(
+        f'[tool.mypy]\npython_version = "{python_version}"\n', encoding="utf-8"
+    )
+
+
+def test_pyproject_pin_is_appended_to_github_output(
+    isolated_environment: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_pyproject(isolated_environment, "3.11")
+    github_output = isolated_environment / "github_output"
+    github_output.write_text("existing=1\n", encoding="utf-8")
+    monkeypatch.setenv("GITHUB_OUTPUT", str(github_output))
+    monkeypatch.setenv("MATRIX_PYTHON_VERSION", "3.12")
+
+    assert resolve_mypy_pin.main() == 0
+
+    assert github_output.read_text(encoding="utf-8") == "existing=1\npython-version=3.11\n"
+
+
+def test_override_skips_pyproject(
+    isolated_environment: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_pyproject(isolated_environment, "3.11")
+    monkeypatch.setenv("MYPY_PYTHON_VERSION", " 3.13 ")
+
+    assert resolve_mypy_pin.main() == 0
+
+    assert capsys.readouterr().out == "python-version=3.13\n"
+    assert resolve_mypy_pin.get_mypy_python_version.cache_info().misses == 0
+
+
+@pytest.mark.parametrize("override", ["", "   "])
+def test_blank_override_falls_back_to_pyproject(
+    isolated_environment: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    override: str,
+) -> None:
+    _write_pyproject(isolated_environment, "3.11")
+    monkeypatch.setenv("MYPY_PYTHON_VERSION", override)
+
+    assert resolve_mypy_pin.main() == 0
+
+    assert capsys.readouterr().out == "python-version=3.11\n"
+
+
+def test_missing_pyproject_uses_matrix_version(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("MATRIX_PYTHON_VERSION", "3.12")
+
+    assert resolve_mypy_pin.main() == 0
+
+    assert capsys.readouterr().out == "python-version=3.12\n"
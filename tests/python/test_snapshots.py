@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import date
 from decimal import Decimal
 
+from travel_plan_permission import snapshots
 from travel_plan_permission.models import ApprovalOutcome, TripPlan
 from travel_plan_permission.snapshots import (
     ValidationSnapshotStore,
@@ -151,3 +153,24 @@ def test_flagged_decision_captures_snapshot_and_stays_small(tmp_path) -> None:
     snapshots = store.load_trip_snapshots(plan.trip_id)
     assert len(snapshots) == 1
     assert snapshots[0].results == plan.validation_results
+
+
+def test_policy_version_hash_tracks_validator_rule_changes() -> None:
+    validator = _validator(max_days=10)
+    original = policy_version_hash(validator)
+
+    assert policy_version_hash(validator) == original
+    assert policy_version_hash(_validator(max_days=10)) == original
+
+    rule = validator.rules[0]
+    assert isinstance(rule, DurationLimitRule)
+    rule.max_consecutive_days = 5
+    mutated = policy_version_hash(validator)
+    assert mutated != original
+
+    validator.rules = _validator(max_days=7).rules
+    assert policy_version_hash(validator) not in {original, mutated}
+
+
+def test_snapshot_digests_stay_sha256_for_existing_chains() -> None:
+    assert snapshots._hash_payload({"b": 2, "a": 1}) == hashlib.sha256(b'{"a":1,"b":2}').hexdigest()
@@ -1,4 +1,7 @@
+import hashlib
 import json
+import re
+import zipfile
 from datetime import date
 from decimal import Decimal
 from io import BytesIO
@@ -22,7 +25,8 @@ from travel_plan_permission.mapping import TemplateMapping
 
 
 def _plan() -> TripPlan:
-    return TripPlan(
+    # Trusted literals: skip validation here; see test_plan_factory_matches_validated_model.
+    return TripPlan.model_construct(
         trip_id="TRIP-XL-001",
         traveler_name="Jordan Lee",
         department="FIN-OPS",
@@ -39,24 +43,82 @@ def _plan() -> TripPlan:
     )
 
 
-def test_travel_spreadsheet_template_loads() -> None:
-    template_path = policy_api._default_template_path()
-    assert template_path.is_file()
+def test_plan_factory_matches_validated_model() -> None:
+    plan = _plan()
 
-    workbook = load_workbook(template_path)
+    assert TripPlan.model_validate(plan.model_dump()) == plan
 
-    assert workbook.sheetnames
-    workbook.close()
 
+def _template_digest() -> bytes:
+    with policy_api._default_template_path().open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").digest()
 
-def test_fill_travel_spreadsheet_writes_mapped_fields(tmp_path) -> None:
-    plan = _plan()
-    output_path = tmp_path / "filled.xlsx"
 
-    result = fill_travel_spreadsheet(plan, output_path)
+_XLSX_TIMESTAMP_PATTERN = re.compile(rb"<dcterms:(created|modified)\b[^>]*>[^<]*</dcterms:\1>")
 
-    assert result == output_path
-    workbook = load_workbook(output_path)
+
+def _xlsx_content_digest(source: Path | BytesIO) -> bytes:
+    """Hash every package part with the docProps timestamps stripped."""
+
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(source) as package:
+        for name in sorted(package.namelist()):
+            digest.update(name.encode("utf-8") + b"\0")
+            digest.update(_XLSX_TIMESTAMP_PATTERN.sub(b"", package.read(name)))
+    return digest.digest()
+
+
+_FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _load_canonical_fixture(name: str) -> tuple[CanonicalTripPlan, TripPlan]:
+    payload = json.loads((_FIXTURES_DIR / name).read_bytes())
+    canonical_plan = CanonicalTripPlan.model_validate(payload)
+    return canonical_plan, canonical_trip_plan_to_model(canonical_plan)
+
+
+@pytest.fixture(scope="module")
+def canonical_minimal() -> tuple[CanonicalTripPlan, TripPlan]:
+    """Parse and validate the minimal canonical trip fixture once for this module."""
+
+    return _load_canonical_fixture("sample_trip_plan_minimal.json")
+
+
+@pytest.fixture(scope="module")
+def canonical_rich() -> tuple[CanonicalTripPlan, TripPlan]:
+    """Parse and validate the rich canonical trip fixture once for this module."""
+
+    return _load_canonical_fixture("sample_trip_plan_rich.json")
+
+
+@pytest.fixture(scope="module")
+def template_digest_before_fill() -> bytes:
+    """Hash the bundled template before any test in this module fills it."""
+
+    return _template_digest()
+
+
+@pytest.fixture(scope="module")
+def default_filled_path(tmp_path_factory, template_digest_before_fill) -> Path:  # noqa: ARG001
+    """Fill the template with the default plan once for read-only assertions.
+
+    Depending on ``template_digest_before_fill`` guarantees the template snapshot
+    is taken before this fill runs.
+    """
+
+    output_path = tmp_path_factory.mktemp("xlsx") / "filled.xlsx"
+    return fill_travel_spreadsheet(_plan(), output_path)
+
+
+def test_travel_spreadsheet_template_loads(template_workbook) -> None:
+    assert policy_api._default_template_path().is_file()
+    assert template_workbook.sheetnames
+
+
+def test_fill_travel_spreadsheet_writes_mapped_fields(default_filled_path) -> None:
+    plan = _plan()
+
+    workbook = load_workbook(default_filled_path)
     sheet = workbook.active
 
     assert sheet["B3"].value == plan.traveler_name
@@ -82,35 +144,34 @@ def test_render_travel_spreadsheet_bytes_returns_xlsx_bytes() -> None:
 
     output_bytes = render_travel_spreadsheet_bytes(plan)
 
-    workbook = load_workbook(BytesIO(output_bytes))
+    workbook = load_workbook(BytesIO(output_bytes), read_only=True)
     assert workbook.sheetnames
     workbook.close()
 
 
-def test_fill_travel_spreadsheet_matches_rendered_bytes(tmp_path) -> None:
-    plan = _plan()
-    output_path = tmp_path / "filled-match.xlsx"
+def test_fill_travel_spreadsheet_matches_rendered_bytes(default_filled_path) -> None:
+    output_bytes = render_travel_spreadsheet_bytes(_plan())
 
-    output_bytes = render_travel_spreadsheet_bytes(plan)
-    fill_travel_spreadsheet(plan, output_path)
+    # Identical packages apart from the document timestamps need no cell walk
+    if _xlsx_content_digest(BytesIO(output_bytes)) == _xlsx_content_digest(default_filled_path):
+        return
 
-    # Compare workbook contents instead of raw bytes (which include timestamps)
-    wb_from_bytes = load_workbook(BytesIO(output_bytes))
-    wb_from_file = load_workbook(output_path)
+    # Otherwise compare workbook contents cell by cell for a useful mismatch report
+    wb_from_bytes = load_workbook(BytesIO(output_bytes), read_only=True, data_only=False)
+    wb_from_file = load_workbook(default_filled_path, read_only=True, data_only=False)
 
     # Compare sheet names
     assert wb_from_bytes.sheetnames == wb_from_file.sheetnames
 
-    # Compare cell values in all sheets
+    # Walk both sheets row by row instead of indexing cells by coordinate
     for sheet_name in wb_from_bytes.sheetnames:
-        sheet_bytes = wb_from_bytes[sheet_name]
-        sheet_file = wb_from_file[sheet_name]
+        rows_bytes = wb_from_bytes[sheet_name].iter_rows(values_only=True)
+        rows_file = wb_from_file[sheet_name].iter_rows(values_only=True)
 
-        # Compare all cell values
-        for row in sheet_bytes.iter_rows():
-            for cell in row:
-                file_cell = sheet_file[cell.coordinate]
-                assert file_cell.value == cell.value, f"Mismatch at {cell.coordinate}"
+        for row_number, (row_bytes, row_file) in enumerate(
+            zip(rows_bytes, rows_file, strict=True), start=1
+        ):
+            assert row_file == row_bytes, f"Mismatch in {sheet_name} row {row_number}"
 
     wb_from_bytes.close()
     wb_from_file.close()
@@ -136,16 +197,11 @@ def test_fill_travel_spreadsheet_rounds_currency_values(tmp_path) -> None:
     workbook.close()
 
 
-def test_fill_travel_spreadsheet_does_not_modify_template(tmp_path) -> None:
-    template_path = policy_api._default_template_path()
-    template_bytes = template_path.read_bytes()
-    plan = _plan()
-    output_path = tmp_path / "filled.xlsx"
-
-    fill_travel_spreadsheet(plan, output_path)
-
-    assert output_path.is_file()
-    assert template_path.read_bytes() == template_bytes
+def test_fill_travel_spreadsheet_does_not_modify_template(
+    default_filled_path, template_digest_before_fill
+) -> None:
+    assert default_filled_path.is_file()
+    assert _template_digest() == template_digest_before_fill
 
 
 def test_fill_travel_spreadsheet_uses_mapping_cells(tmp_path, monkeypatch) -> None:
@@ -242,13 +298,8 @@ def test_fill_travel_spreadsheet_uses_template_metadata(tmp_path, monkeypatch) -
     assert observed["template_file"] == "custom_template.xlsx"
 
 
-def test_fill_travel_spreadsheet_uses_canonical_fields(tmp_path) -> None:
-    fixture_path = (
-        Path(__file__).resolve().parents[1] / "fixtures" / "sample_trip_plan_minimal.json"
-    )
-    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
-    canonical_plan = CanonicalTripPlan.model_validate(payload)
-    trip_plan = canonical_trip_plan_to_model(canonical_plan)
+def test_fill_travel_spreadsheet_uses_canonical_fields(tmp_path, canonical_minimal) -> None:
+    canonical_plan, trip_plan = canonical_minimal
     output_path = tmp_path / "filled-canonical.xlsx"
 
     fill_travel_spreadsheet(trip_plan, output_path, canonical_plan=canonical_plan)
@@ -265,12 +316,9 @@ def test_fill_travel_spreadsheet_uses_canonical_fields(tmp_path) -> None:
 
 
 def test_fill_travel_spreadsheet_populates_flight_and_hotel_preferences(
-    tmp_path,
+    tmp_path, canonical_rich
 ) -> None:
-    fixture_path = Path(__file__).resolve().parents[1] / "fixtures" / "sample_trip_plan_rich.json"
-    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
-    canonical_plan = CanonicalTripPlan.model_validate(payload)
-    trip_plan = canonical_trip_plan_to_model(canonical_plan)
+    canonical_plan, trip_plan = canonical_rich
     output_path = tmp_path / "filled-rich.xlsx"
 
     fill_travel_spreadsheet(trip_plan, output_path, canonical_plan=canonical_plan)
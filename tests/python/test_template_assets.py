@@ -1,18 +1,45 @@
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
-from openpyxl import load_workbook
-from openpyxl.utils.cell import coordinate_from_string
+from openpyxl import Workbook
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 
 from travel_plan_permission import policy_api
 from travel_plan_permission.mapping import (
     DEFAULT_TEMPLATE_VERSION,
+    TemplateMapping,
     load_template_mapping,
 )
 
 
-def test_template_asset_loads_and_matches_mapping() -> None:
+@pytest.fixture(scope="module")
+def template_mapping() -> TemplateMapping:
+    """Load the default template mapping once for this module."""
+
+    return load_template_mapping()
+
+
+def _values_at(sheet: Any, cell_refs: Iterable[str]) -> dict[str, object]:
+    """Collect the values at ``cell_refs`` in a single pass over the sheet rows."""
+
+    targets: dict[tuple[int, int], str] = {}
+    for cell_ref in cell_refs:
+        column_letter, row = coordinate_from_string(cell_ref)
+        targets[(row, column_index_from_string(column_letter))] = cell_ref
+
+    values: dict[str, object] = {}
+    for row_index, row_values in enumerate(sheet.iter_rows(values_only=True), start=1):
+        for column_index, value in enumerate(row_values, start=1):
+            cell_ref = targets.get((row_index, column_index))
+            if cell_ref is not None:
+                values[cell_ref] = value
+    return values
+
+
+def test_template_asset_matches_mapping_metadata() -> None:
     mapping = load_template_mapping()
     template_file = mapping.metadata.get("template_file")
     assert template_file
@@ -21,19 +48,35 @@ def test_template_asset_loads_and_matches_mapping() -> None:
     assert template_path.parent.name == "templates"
     assert template_path.name == template_file
 
-    workbook = load_workbook(template_path)
-    sheet = workbook.active
+
+def test_template_asset_populates_mapped_cells(
+    template_mapping: TemplateMapping,
+    template_workbook: Workbook,
+) -> None:
+    mapping = template_mapping
+    values = _values_at(template_workbook.active, mapping.cells.values())
 
     for cell_ref in mapping.cells.values():
-        coordinate_from_string(cell_ref)
-        assert sheet[cell_ref].value not in (None, "")
+        assert values.get(cell_ref) not in (None, ""), cell_ref
+
 
+def test_template_asset_contains_mapped_formulas(
+    template_mapping: TemplateMapping,
+    template_workbook: Workbook,
+) -> None:
+    mapping = template_mapping
+    expected: dict[str, str] = {}
     for formula_config in mapping.formulas.values():
         cell_ref = formula_config.get("cell")
         formula = formula_config.get("formula")
         assert isinstance(cell_ref, str)
         assert isinstance(formula, str)
-        assert sheet[cell_ref].value == formula
+        expected[cell_ref] = formula
+
+    values = _values_at(template_workbook.active, expected)
+
+    for cell_ref, formula in expected.items():
+        assert values.get(cell_ref) == formula, cell_ref
 
 
 def test_template_mapping_requires_template_asset(tmp_path: Path) -> None:
@@ -45,3 +45,14 @@ def test_find_workflow_issues_accepts_expected_command() -> None:
     )
 
     assert find_workflow_issues(content) == []
+
+
+def test_find_workflow_issues_matches_legacy_markers_case_insensitively() -> None:
+    issues = find_workflow_issues("run: PIP-COMPILE -o Requirements-Dev.lock\nrun: my-pip-compiler")
+
+    assert "Found pip-compile usage; expected uv pip compile." in issues
+    assert "Found requirements-dev.lock usage; expected single requirements.lock." in issues
+    assert find_workflow_issues("run: pip-compiler -o requirements-dev.locked") == [
+        "Expected uv pip compile command with extras is missing.",
+        "Expected verification subprocess.run for uv pip compile with extras is missing.",
+    ]
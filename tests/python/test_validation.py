@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
+import pytest
+
 from travel_plan_permission.models import ExpenseCategory, TripPlan
 from travel_plan_permission.providers import ProviderRegistry, ProviderType
 from travel_plan_permission.validation import (
@@ -26,7 +28,8 @@ def _build_plan(
     estimated_cost: Decimal = Decimal("1000"),
     expense_breakdown: dict[ExpenseCategory, Decimal] | None = None,
 ) -> TripPlan:
-    return TripPlan(
+    # Trusted literals: skip validation here; see test_build_plan_matches_validated_model.
+    return TripPlan.model_construct(
         trip_id="TRIP-100",
         traveler_name="Alex Doe",
         destination=destination,
@@ -38,154 +41,184 @@ def _build_plan(
     )
 
 
+def test_build_plan_matches_validated_model() -> None:
+    plan = _build_plan(
+        departure=date(2025, 5, 5),
+        return_date=date(2025, 5, 10),
+        expense_breakdown={ExpenseCategory.LODGING: Decimal("400")},
+    )
+
+    assert TripPlan.model_validate(plan.model_dump()) == plan
+
+
+@pytest.fixture(scope="class")
+def advance_rule() -> AdvanceBookingRule:
+    return AdvanceBookingRule(
+        name="advance_booking",
+        code="ADV",
+        min_days_domestic=7,
+        min_days_international=14,
+        international_destinations=["paris"],
+    )
+
+
+@pytest.fixture(scope="class")
+def budget_rule() -> BudgetLimitRule:
+    return BudgetLimitRule(
+        name="budget_rule",
+        code="BUD-001",
+        trip_limit=Decimal("1500"),
+        category_limits={"lodging": Decimal("500"), "meals": Decimal("200")},
+    )
+
+
+@pytest.fixture(scope="class")
+def duration_rule() -> DurationLimitRule:
+    return DurationLimitRule(
+        name="duration_limit",
+        code="DUR-001",
+        max_consecutive_days=5,
+    )
+
+
 class TestAdvanceBookingRule:
     """Advance booking rule behavior."""
 
-    def test_blocks_when_notice_too_short(self) -> None:
-        rule = AdvanceBookingRule(
-            name="advance_domestic",
-            code="ADV-DOM",
-            min_days_domestic=7,
-            min_days_international=14,
-            international_destinations=["paris"],
-        )
+    def test_blocks_when_notice_too_short(self, advance_rule: AdvanceBookingRule) -> None:
         plan = _build_plan(
             departure=date(2025, 5, 5),
             return_date=date(2025, 5, 10),
             destination="New York, NY",
         )
 
-        results = rule.evaluate(plan, reference_date=date(2025, 5, 1))
+        results = advance_rule.evaluate(plan, reference_date=date(2025, 5, 1))
 
         assert results == [
             ValidationResult(
-                code="ADV-DOM",
+                code="ADV",
                 message="Trips must be booked at least 7 days in advance; only 4 days provided",
                 severity=ValidationSeverity.ERROR,
-                rule_name="advance_domestic",
+                rule_name="advance_booking",
                 blocking=True,
             )
         ]
 
-    def test_international_notice_uses_international_threshold(self) -> None:
-        rule = AdvanceBookingRule(
-            name="advance_international",
-            code="ADV-INTL",
-            min_days_domestic=7,
-            min_days_international=14,
-            international_destinations=["paris"],
-        )
-        plan = _build_plan(
-            departure=date(2025, 5, 20),
-            return_date=date(2025, 5, 26),
-            destination="Paris, France",
-        )
-
-        results = rule.evaluate(plan, reference_date=date(2025, 5, 10))
-
-        assert results and results[0].message.startswith("Trips must be booked at least 14")
-
-    def test_passes_when_notice_is_sufficient(self) -> None:
-        rule = AdvanceBookingRule(
-            name="advance_ok",
-            code="ADV-OK",
-            min_days_domestic=7,
-            international_destinations=["london"],
-        )
+    @pytest.mark.parametrize(
+        ("destination", "departure", "reference_date", "expected_messages"),
+        [
+            pytest.param(
+                "Paris, France",
+                date(2025, 5, 20),
+                date(2025, 5, 10),
+                ["Trips must be booked at least 14 days in advance; only 10 days provided"],
+                id="international-threshold",
+            ),
+            pytest.param(
+                "Chicago, IL",
+                date(2025, 6, 1),
+                date(2025, 5, 20),
+                [],
+                id="sufficient-notice",
+            ),
+        ],
+    )
+    def test_notice_thresholds(
+        self,
+        advance_rule: AdvanceBookingRule,
+        destination: str,
+        departure: date,
+        reference_date: date,
+        expected_messages: list[str],
+    ) -> None:
         plan = _build_plan(
-            departure=date(2025, 6, 1),
-            return_date=date(2025, 6, 5),
-            destination="Chicago, IL",
+            departure=departure,
+            return_date=departure + timedelta(days=5),
+            destination=destination,
         )
 
-        results = rule.evaluate(plan, reference_date=date(2025, 5, 20))
+        results = advance_rule.evaluate(plan, reference_date=reference_date)
 
-        assert results == []
+        assert [result.message for result in results] == expected_messages
 
 
 class TestBudgetLimitRule:
     """Budget limit rule behavior."""
 
-    def test_trip_and_category_limits(self) -> None:
-        rule = BudgetLimitRule(
-            name="budget_rule",
-            code="BUD-001",
-            trip_limit=Decimal("1500"),
-            category_limits={"lodging": Decimal("500"), "meals": Decimal("200")},
-        )
+    @pytest.mark.parametrize(
+        ("estimated_cost", "expense_breakdown", "expected_messages"),
+        [
+            pytest.param(
+                Decimal("1800"),
+                {
+                    ExpenseCategory.LODGING: Decimal("650"),
+                    ExpenseCategory.MEALS: Decimal("220"),
+                },
+                {
+                    "Estimated cost 1800 exceeds trip limit 1500",
+                    "Planned lodging spend 650 exceeds limit 500",
+                    "Planned meals spend 220 exceeds limit 200",
+                },
+                id="trip-and-category-limits",
+            ),
+            pytest.param(
+                Decimal("1200"),
+                {ExpenseCategory.LODGING: Decimal("450")},
+                set(),
+                id="within-limits",
+            ),
+        ],
+    )
+    def test_trip_and_category_limits(
+        self,
+        budget_rule: BudgetLimitRule,
+        estimated_cost: Decimal,
+        expense_breakdown: dict[ExpenseCategory, Decimal],
+        expected_messages: set[str],
+    ) -> None:
         plan = _build_plan(
             departure=date(2025, 4, 1),
             return_date=date(2025, 4, 3),
-            estimated_cost=Decimal("1800"),
-            expense_breakdown={
-                ExpenseCategory.LODGING: Decimal("650"),
-                ExpenseCategory.MEALS: Decimal("220"),
-            },
+            estimated_cost=estimated_cost,
+            expense_breakdown=expense_breakdown,
         )
 
-        results = rule.evaluate(plan)
-
-        messages = {result.message for result in results}
-        assert len(results) == 3
-        assert "Estimated cost 1800 exceeds trip limit 1500" in messages
-        assert "Planned lodging spend 650 exceeds limit 500" in messages
-        assert "Planned meals spend 220 exceeds limit 200" in messages
+        results = budget_rule.evaluate(plan)
 
-    def test_passes_when_within_limits(self) -> None:
-        rule = BudgetLimitRule(
-            name="budget_ok",
-            code="BUD-OK",
-            trip_limit=Decimal("2000"),
-            category_limits={"lodging": Decimal("800")},
-        )
-        plan = _build_plan(
-            departure=date(2025, 4, 10),
-            return_date=date(2025, 4, 12),
-            estimated_cost=Decimal("1500"),
-            expense_breakdown={ExpenseCategory.LODGING: Decimal("600")},
-        )
-
-        assert rule.evaluate(plan) == []
+        assert len(results) == len(expected_messages)
+        assert {result.message for result in results} == expected_messages
 
 
 class TestDurationLimitRule:
     """Duration limit rule behavior."""
 
-    def test_blocks_when_duration_exceeds_max(self) -> None:
-        rule = DurationLimitRule(
-            name="duration_limit",
-            code="DUR-001",
-            max_consecutive_days=5,
-        )
-        plan = _build_plan(
-            departure=date(2025, 3, 1),
-            return_date=date(2025, 3, 8),
-        )
-
-        results = rule.evaluate(plan)
-
-        assert results == [
-            ValidationResult(
-                code="DUR-001",
-                message="Trip duration 8 days exceeds maximum of 5",
-                severity=ValidationSeverity.ERROR,
-                rule_name="duration_limit",
-                blocking=True,
-            )
-        ]
-
-    def test_allows_duration_within_limit(self) -> None:
-        rule = DurationLimitRule(
-            name="duration_limit",
-            code="DUR-001",
-            max_consecutive_days=10,
-        )
-        plan = _build_plan(
-            departure=date(2025, 3, 1),
-            return_date=date(2025, 3, 5),
-        )
-
-        assert rule.evaluate(plan) == []
+    @pytest.mark.parametrize(
+        ("return_date", "expected"),
+        [
+            pytest.param(
+                date(2025, 3, 8),
+                [
+                    ValidationResult(
+                        code="DUR-001",
+                        message="Trip duration 8 days exceeds maximum of 5",
+                        severity=ValidationSeverity.ERROR,
+                        rule_name="duration_limit",
+                        blocking=True,
+                    )
+                ],
+                id="exceeds-max",
+            ),
+            pytest.param(date(2025, 3, 5), [], id="at-max"),
+        ],
+    )
+    def test_duration_limit(
+        self,
+        duration_rule: DurationLimitRule,
+        return_date: date,
+        expected: list[ValidationResult],
+    ) -> None:
+        plan = _build_plan(departure=date(2025, 3, 1), return_date=return_date)
+
+        assert duration_rule.evaluate(plan) == expected
 
 
 class TestProviderApprovalRule:
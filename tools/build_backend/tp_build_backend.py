@@ -1,18 +1,26 @@
 import base64
-import csv
+import functools
 import hashlib
-import os
+import io
 import pathlib
+import shutil
 import tarfile
-import tempfile
 import tomllib
 import zipfile
+from collections.abc import Iterator
+from typing import BinaryIO
+
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+_COPY_CHUNK_SIZE = 1 << 16
+# Already-compressed formats gain nothing from another deflate pass.
+_PRECOMPRESSED_SUFFIXES = (".xlsx", ".png", ".jpg", ".jpeg", ".gif", ".gz", ".zip", ".whl")
 
 
 def _project_root() -> pathlib.Path:
-    return pathlib.Path(__file__).resolve().parents[2]
+    return _PROJECT_ROOT
 
 
+@functools.lru_cache(maxsize=1)
 def _load_project_config() -> dict:
     pyproject_path = _project_root() / "pyproject.toml"
     with pyproject_path.open("rb") as handle:
@@ -24,7 +32,13 @@ def _normalize_name(name: str) -> str:
     return "".join("_" if ch in "-." else ch for ch in name).lower()
 
 
-def _build_metadata(project: dict) -> str:
+@functools.lru_cache(maxsize=1)
+def _dist_name_and_version() -> tuple[str, str]:
+    project = _load_project_config()
+    return _normalize_name(project["name"]), project["version"]
+
+
+def _write_metadata(project: dict, stream: io.TextIOBase) -> None:
     lines = [
         "Metadata-Version: 2.1",
         f"Name: {project['name']}",
@@ -65,120 +79,190 @@ def _build_metadata(project: dict) -> str:
         for requirement in requirements:
             lines.append(f'Requires-Dist: {requirement}; extra == "{extra}"')
 
+    readme = None
     readme_path = project.get("readme")
-    readme_content = ""
     if readme_path:
         candidate = _project_root() / readme_path
-        if candidate.exists():
-            readme_content = candidate.read_text(encoding="utf-8")
-            if readme_content:
-                lines.append("Description-Content-Type: text/markdown")
+        if candidate.exists() and candidate.stat().st_size:
+            readme = candidate
+            lines.append("Description-Content-Type: text/markdown")
 
-    lines.append("")
-    if readme_content:
-        lines.append(readme_content)
+    for line in lines:
+        stream.write(f"{line}\n")
+    if readme is not None:
+        stream.write("\n")
+        with readme.open(encoding="utf-8") as handle:
+            shutil.copyfileobj(handle, stream)
 
-    return "\n".join(lines)
 
-
-def _write_dist_info(dist_info_path: pathlib.Path, project: dict) -> None:
-    dist_info_path.mkdir(parents=True, exist_ok=True)
-    metadata = _build_metadata(project)
-    (dist_info_path / "METADATA").write_text(metadata, encoding="utf-8")
-    wheel_metadata = "\n".join(
-        [
-            "Wheel-Version: 1.0",
-            "Generator: tp_build_backend",
-            "Root-Is-Purelib: true",
-            "Tag: py3-none-any",
-        ]
-    )
-    (dist_info_path / "WHEEL").write_text(wheel_metadata, encoding="utf-8")
+@functools.lru_cache(maxsize=1)
+def _dist_info_files() -> tuple[tuple[str, bytes], ...]:
+    # METADATA is not included: it embeds the README and is streamed by its writers.
+    project = _load_project_config()
+    files = {
+        "WHEEL": "\n".join(
+            [
+                "Wheel-Version: 1.0",
+                "Generator: tp_build_backend",
+                "Root-Is-Purelib: true",
+                "Tag: py3-none-any",
+            ]
+        )
+    }
 
     scripts = project.get("scripts", {})
     if scripts:
         lines = ["[console_scripts]"]
         for name, target in scripts.items():
             lines.append(f"{name} = {target}")
-        (dist_info_path / "entry_points.txt").write_text("\n".join(lines), encoding="utf-8")
+        files["entry_points.txt"] = "\n".join(lines)
+    return tuple((name, content.encode("utf-8")) for name, content in files.items())
 
 
-def _record_files(root: pathlib.Path, dist_info_path: pathlib.Path) -> None:
-    record_rows = []
-    for path in sorted(root.rglob("*")):
-        if path.is_dir():
-            continue
-        rel_path = path.relative_to(root).as_posix()
-        if rel_path == f"{dist_info_path.name}/RECORD":
-            continue
-        digest = hashlib.sha256(path.read_bytes()).digest()
-        encoded = base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
-        record_rows.append((rel_path, f"sha256={encoded}", str(path.stat().st_size)))
+class _HashingWriter(io.RawIOBase):
+    """Forward bytes to ``target`` while tracking their sha256 digest and size."""
+
+    def __init__(self, target: BinaryIO) -> None:
+        self._target = target
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        self.size += len(data)
+        self._target.write(data)
+        return len(data)
+
+
+def _prepared_dist_info_paths(dist_info_path: pathlib.Path) -> list[pathlib.Path]:
+    return [
+        path
+        for path in sorted(dist_info_path.iterdir())
+        if path.is_file() and path.name != "RECORD"
+    ]
+
+
+def _write_dist_info(dist_info_path: pathlib.Path) -> None:
+    dist_info_path.mkdir(parents=True, exist_ok=True)
+    with (dist_info_path / "METADATA").open("w", encoding="utf-8", newline="") as stream:
+        _write_metadata(_load_project_config(), stream)
+    for name, content in _dist_info_files():
+        (dist_info_path / name).write_bytes(content)
+
+
+def _record_row(arcname: str, digest: bytes, size: int) -> tuple[str, str, str]:
+    encoded = base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+    return (arcname, f"sha256={encoded}", str(size))
+
+
+def _record_path(arcname: str) -> str:
+    if any(ch in arcname for ch in ',"\r\n'):
+        return '"' + arcname.replace('"', '""') + '"'
+    return arcname
+
+
+def _record_contents(record_rows: list[tuple[str, str, str]], record_name: str) -> str:
+    # Hashes and sizes never need quoting, so only paths go through _record_path.
+    rows = sorted(record_rows, key=lambda row: row[0].split("/"))
+    lines = [f"{_record_path(arcname)},{digest},{size}\n" for arcname, digest, size in rows]
+    lines.append(f"{_record_path(record_name)},,\n")
+    return "".join(lines)
 
-    record_rows.append((f"{dist_info_path.name}/RECORD", "", ""))
 
-    record_path = dist_info_path / "RECORD"
-    with record_path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerows(record_rows)
+def _walk_files(
+    root: pathlib.Path, skip_dirs: frozenset[str] = frozenset()
+) -> Iterator[pathlib.Path]:
+    for dirpath, dirnames, filenames in root.walk():
+        if skip_dirs:
+            dirnames[:] = [name for name in dirnames if name not in skip_dirs]
+        for name in filenames:
+            yield dirpath / name
 
 
-def _copy_package_tree(target_root: pathlib.Path) -> None:
+def _package_files() -> list[tuple[pathlib.Path, str]]:
     src_root = _project_root() / "src" / "travel_plan_permission"
-    target = target_root / "travel_plan_permission"
-    if target.exists():
-        return
-    os.makedirs(target_root, exist_ok=True)
-    for path in src_root.rglob("*"):
-        rel_path = path.relative_to(src_root)
-        destination = target / rel_path
-        if path.is_dir():
-            destination.mkdir(parents=True, exist_ok=True)
-            continue
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_bytes(path.read_bytes())
-
-
-def _write_editable_pth(target_root: pathlib.Path) -> None:
-    src_path = _project_root() / "src"
-    pth_name = f"{_normalize_name(_load_project_config()['name'])}.pth"
-    (target_root / pth_name).write_text(str(src_path), encoding="utf-8")
-
-
-def _build_wheel(wheel_directory: str, editable: bool) -> str:
-    project = _load_project_config()
-    dist_name = _normalize_name(project["name"])
-    version = project["version"]
+    return [
+        (path, f"travel_plan_permission/{path.relative_to(src_root).as_posix()}")
+        for path in _walk_files(src_root)
+    ]
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        root = pathlib.Path(temp_dir)
 
+def _add_to_wheel(archive: zipfile.ZipFile, arcname: str, data: bytes) -> tuple[str, str, str]:
+    archive.writestr(arcname, data)
+    return _record_row(arcname, hashlib.sha256(data).digest(), len(data))
+
+
+def _add_metadata_to_wheel(archive: zipfile.ZipFile, arcname: str) -> tuple[str, str, str]:
+    # The README is copied straight into the zip entry, hashed on the way through.
+    with archive.open(arcname, "w") as target:
+        writer = _HashingWriter(target)
+        stream = io.TextIOWrapper(writer, encoding="utf-8", newline="", write_through=True)
+        _write_metadata(_load_project_config(), stream)
+        stream.flush()
+        stream.detach()
+    return _record_row(arcname, writer.digest.digest(), writer.size)
+
+
+def _add_file_to_wheel(
+    archive: zipfile.ZipFile, arcname: str, path: pathlib.Path
+) -> tuple[str, str, str]:
+    # One read per chunk feeds the archive, the RECORD hash and the size.
+    digest = hashlib.sha256()
+    size = 0
+    # from_file keeps the file's mtime and permission bits, as archive.write did.
+    info = zipfile.ZipInfo.from_file(path, arcname)
+    if arcname.lower().endswith(_PRECOMPRESSED_SUFFIXES):
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = archive.compression
+    with path.open("rb") as source, archive.open(info, "w") as target:
+        while chunk := source.read(_COPY_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+            target.write(chunk)
+    return _record_row(arcname, digest.digest(), size)
+
+
+def _build_wheel(wheel_directory: str, editable: bool, metadata_directory: str | None) -> str:
+    dist_name, version = _dist_name_and_version()
+    dist_info_name = f"{dist_name}-{version}.dist-info"
+    wheel_name = f"{dist_name}-{version}-py3-none-any.whl"
+    wheel_path = pathlib.Path(wheel_directory) / wheel_name
+    record_rows = []
+    with zipfile.ZipFile(wheel_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
         if editable:
-            _write_editable_pth(root)
+            pth_contents = str(_project_root() / "src").encode("utf-8")
+            record_rows.append(_add_to_wheel(archive, f"{dist_name}.pth", pth_contents))
         else:
-            _copy_package_tree(root)
-
-        dist_info = root / f"{dist_name}-{version}.dist-info"
-        _write_dist_info(dist_info, project)
-        _record_files(root, dist_info)
+            for path, arcname in _package_files():
+                record_rows.append(_add_file_to_wheel(archive, arcname, path))
+
+        # PEP 517: reuse the .dist-info a frontend already prepared in an earlier hook call.
+        if metadata_directory is not None:
+            for path in _prepared_dist_info_paths(pathlib.Path(metadata_directory)):
+                arcname = f"{dist_info_name}/{path.name}"
+                record_rows.append(_add_file_to_wheel(archive, arcname, path))
+        else:
+            record_rows.append(_add_metadata_to_wheel(archive, f"{dist_info_name}/METADATA"))
+            for name, content in _dist_info_files():
+                arcname = f"{dist_info_name}/{name}"
+                record_rows.append(_add_to_wheel(archive, arcname, content))
 
-        wheel_name = f"{dist_name}-{version}-py3-none-any.whl"
-        wheel_path = pathlib.Path(wheel_directory) / wheel_name
-        with zipfile.ZipFile(wheel_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-            for file_path in root.rglob("*"):
-                if file_path.is_dir():
-                    continue
-                archive.write(file_path, file_path.relative_to(root).as_posix())
+        record_name = f"{dist_info_name}/RECORD"
+        archive.writestr(record_name, _record_contents(record_rows, record_name))
 
     return wheel_name
 
 
-def build_wheel(wheel_directory: str, _config_settings=None, _metadata_directory=None) -> str:
-    return _build_wheel(wheel_directory, editable=False)
+def build_wheel(wheel_directory: str, _config_settings=None, metadata_directory=None) -> str:
+    return _build_wheel(wheel_directory, editable=False, metadata_directory=metadata_directory)
 
 
-def build_editable(wheel_directory: str, _config_settings=None, _metadata_directory=None) -> str:
-    return _build_wheel(wheel_directory, editable=True)
+def build_editable(wheel_directory: str, _config_settings=None, metadata_directory=None) -> str:
+    return _build_wheel(wheel_directory, editable=True, metadata_directory=metadata_directory)
 
 
 def get_requires_for_build_wheel(_config_settings=None) -> list[str]:
@@ -194,9 +278,7 @@ def get_requires_for_build_sdist(_config_settings=None) -> list[str]:
 
 
 def build_sdist(sdist_directory: str, _config_settings=None) -> str:
-    project = _load_project_config()
-    dist_name = _normalize_name(project["name"])
-    version = project["version"]
+    dist_name, version = _dist_name_and_version()
     sdist_name = f"{dist_name}-{version}.tar.gz"
     root_dir = f"{dist_name}-{version}"
     sdist_path = pathlib.Path(sdist_directory) / sdist_name
@@ -209,26 +291,22 @@ def build_sdist(sdist_directory: str, _config_settings=None) -> str:
                 tar.add(candidate, arcname=f"{root_dir}/{rel_path}")
         backend_root = project_root / "tools" / "build_backend"
         if backend_root.exists():
-            for path in backend_root.rglob("*"):
-                if path.is_dir() or "__pycache__" in path.parts:
-                    continue
+            for path in _walk_files(backend_root, frozenset({"__pycache__"})):
                 tar.add(
                     path,
                     arcname=f"{root_dir}/tools/build_backend/{path.relative_to(backend_root)}",
                 )
         src_root = project_root / "src"
-        for path in src_root.rglob("*"):
+        for path in _walk_files(src_root):
             tar.add(path, arcname=f"{root_dir}/src/{path.relative_to(src_root)}")
 
     return sdist_name
 
 
 def prepare_metadata_for_build_wheel(metadata_directory: str, _config_settings=None) -> str:
-    project = _load_project_config()
-    dist_name = _normalize_name(project["name"])
-    version = project["version"]
+    dist_name, version = _dist_name_and_version()
     dist_info = pathlib.Path(metadata_directory) / f"{dist_name}-{version}.dist-info"
-    _write_dist_info(dist_info, project)
+    _write_dist_info(dist_info)
     return dist_info.name
 
 
@@ -6,57 +6,40 @@ only runs once per CI matrix (avoiding duplicate type-checking across Python
 versions).
 
 The script:
-1. Reads the target Python version from pyproject.toml's [tool.mypy] section
-2. Falls back to the first version in the CI matrix
-3. Outputs the resolved version to GITHUB_OUTPUT for workflow use
+1. Uses MYPY_PYTHON_VERSION verbatim when a workflow already resolved the pin
+2. Otherwise reads the target Python version from pyproject.toml's [tool.mypy] section
+3. Falls back to the first version in the CI matrix
+4. Outputs the resolved version to GITHUB_OUTPUT for workflow use
+
+This file started as a copy of the Workflows consumer template and is now
+maintained in this repository (see docs/SETUP_CHECKLIST.md). Do not overwrite it
+when re-syncing the template.
 """
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
-from pathlib import Path
+import tomllib
 
 
+@functools.lru_cache(maxsize=1)
 def get_mypy_python_version() -> str | None:
-    """Extract python_version from pyproject.toml's [tool.mypy] section."""
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
-        return None
+    """Extract python_version from pyproject.toml's [tool.mypy] section.
 
+    The result is cached for the life of the process; the file is read relative
+    to the working directory at the first call.
+    """
     try:
-        # Try tomlkit first (more accurate TOML parsing)
-        import tomlkit
-
-        content = pyproject_path.read_text()
-        data = tomlkit.parse(content)
-        tool_raw = data.get("tool")
-        # Use dict() to normalize tomlkit types and satisfy mypy
-        # tomlkit returns Table objects that act like dicts but mypy doesn't know this
-        tool: dict[str, object] = dict(tool_raw) if hasattr(tool_raw, "get") else {}  # type: ignore[arg-type,call-overload]
-        mypy_raw = tool.get("mypy")
-        mypy: dict[str, object] = dict(mypy_raw) if hasattr(mypy_raw, "get") else {}  # type: ignore[arg-type,call-overload]
-        version = mypy.get("python_version")
-        # Validate type before conversion - TOML can parse various types
-        if isinstance(version, (str, int, float)):
-            return str(version)
+        with open("pyproject.toml", "rb") as handle:
+            data = tomllib.load(handle)
+    except FileNotFoundError:
         return None
-    except ImportError:
-        pass
-
-    # Fallback: simple regex-based extraction
-    import re
-
-    content = pyproject_path.read_text()
-    # Match python_version in [tool.mypy] section
-    match = re.search(
-        r'\[tool\.mypy\].*?python_version\s*=\s*["\']?(\d+\.\d+)["\']?',
-        content,
-        re.DOTALL,
-    )
-    if match:
-        return match.group(1)
-
+    version = data.get("tool", {}).get("mypy", {}).get("python_version")
+    # Validate type before conversion - TOML can parse various types
+    if isinstance(version, (str, int, float)):
+        return str(version)
     return None
 
 
@@ -65,8 +48,9 @@ def main() -> int:
     # Get the current matrix Python version from environment
     matrix_version = os.environ.get("MATRIX_PYTHON_VERSION", "")
 
-    # Get the mypy-configured Python version from pyproject.toml
-    mypy_version = get_mypy_python_version()
+    # A pin resolved once upstream (e.g. by an earlier job) skips the TOML parse;
+    # otherwise get the mypy-configured Python version from pyproject.toml
+    mypy_version = os.environ.get("MYPY_PYTHON_VERSION", "").strip() or get_mypy_python_version()
 
     # Determine which version to output
     # If mypy has a configured version, use it; otherwise use matrix version
@@ -79,7 +63,8 @@ def main() -> int:
     # Write to GITHUB_OUTPUT
     github_output = os.environ.get("GITHUB_OUTPUT")
     if github_output:
-        with open(github_output, "a") as f:
+        # One buffered append; the file object flushes the whole line on close
+        with open(github_output, "a", encoding="utf-8") as f:
             f.write(f"python-version={output_version}\n")
         print(f"Resolved mypy Python version: {output_version}")
     else: